@@ -0,0 +1,41 @@
+"""
+Batch sequence kernels
+Vectorized helpers that process many sequences in one numpy call instead of
+one Python-level pass per sequence
+"""
+
+import numpy as np
+from typing import List
+
+
+def batch_composition(sequences: List[str], alphabet: str) -> np.ndarray:
+    """Count the letters of an alphabet in every sequence with a single bincount
+    
+    All sequences are concatenated into one flat byte buffer; each byte is
+    tagged with its row and mapped to its alphabet index, so one bincount over
+    (row, letter) pairs yields the whole composition table.
+    
+    Args:
+        sequences (List[str]): Sequences to count
+        alphabet (str): ASCII letters to count (case-sensitive)
+    
+    Returns:
+        np.ndarray: int64 array of shape (len(sequences), len(alphabet)) where
+            [i, j] is the number of alphabet[j] in sequences[i]
+    """
+    # One extra column collects every character outside the alphabet
+    width = len(alphabet) + 1
+    if not sequences:
+        return np.zeros((0, len(alphabet)), dtype=np.int64)
+    
+    encoded = [sequence.encode('utf-8') for sequence in sequences]
+    flat = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    lengths = np.fromiter((len(data) for data in encoded), dtype=np.intp, count=len(encoded))
+    
+    # Byte value -> alphabet index (len(alphabet) for anything else)
+    letter_index = np.full(256, len(alphabet), dtype=np.intp)
+    letter_index[np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)] = np.arange(len(alphabet))
+    
+    rows = np.repeat(np.arange(len(sequences), dtype=np.intp), lengths)
+    counts = np.bincount(rows * width + letter_index[flat], minlength=len(sequences) * width)
+    return counts.reshape(len(sequences), width)[:, :-1]
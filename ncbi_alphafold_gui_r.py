@@ -7,10 +7,10 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                              QSplitter, QFileDialog, QTabWidget, QCheckBox, QComboBox,
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QScrollArea, QTabWidget)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, QThreadPool, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 
-from ncbi_threads import NCBISearchThread, SequenceDownloadThread
+from ncbi_threads import NCBISearchRunnable, SequenceDownloadRunnable
 from ncbi_bulk_threads import BulkDownloadThread, ExcelLoadThread, RetryFailedThread
 from preprocess_dna import SequenceProcessor
 from alphafold_crawler_2 import AlphaFoldSubmitter
@@ -476,11 +476,11 @@ class MainWindow(QMainWindow):
         self.status_label.setText(f"Searching for '{gene}' in '{organism}'...")
         self.progress_bar.setVisible(True)
         
-        # Create and start the search thread
-        self.search_thread = NCBISearchThread(gene, organism, email)
-        self.search_thread.result_signal.connect(self.display_search_results)
-        self.search_thread.error_signal.connect(self.handle_error)
-        self.search_thread.start()
+        # Create the search task and run it on the shared thread pool
+        self.search_task = NCBISearchRunnable(gene, organism, email)
+        self.search_task.signals.result_signal.connect(self.display_search_results)
+        self.search_task.signals.error_signal.connect(self.handle_error)
+        QThreadPool.globalInstance().start(self.search_task)
 
     def display_search_results(self, results):
         """Display search results and create selection widgets"""
@@ -562,15 +562,15 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
         self.download_button.setEnabled(False)  # Disable button during download
         
-        # Create and start the download thread
-        self.download_thread = SequenceDownloadThread(self.selected_result_id, seq_length, email, output_dir)
-        self.download_thread.finished_signal.connect(self.handle_download_finished)
-        self.download_thread.error_signal.connect(self.handle_error)
+        # Create the download task and run it on the shared thread pool
+        self.download_task = SequenceDownloadRunnable(self.selected_result_id, seq_length, email, output_dir)
+        self.download_task.signals.finished_signal.connect(self.handle_download_finished)
+        self.download_task.signals.error_signal.connect(self.handle_error)
         
         # Connect to the new progress signal
-        self.download_thread.progress_signal.connect(self.update_status)
+        self.download_task.signals.progress_signal.connect(self.update_status)
         
-        self.download_thread.start()
+        QThreadPool.globalInstance().start(self.download_task)
     
     def update_status(self, message):
         """Update the status label with progress messages"""
@@ -1007,8 +1007,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a ROI pattern.")
             return
         
-        # Load the FASTA file
-        fasta_content = SequenceProcessor.load_fasta_file(self.current_fasta_path)
+        # Load the FASTA file as raw bytes; only the ROI window gets decoded
+        fasta_content = SequenceProcessor.load_fasta_file(self.current_fasta_path, as_bytes=True)
         if not fasta_content:
             QMessageBox.warning(self, "Error", "Failed to load the FASTA file.")
             return
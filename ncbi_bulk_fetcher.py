@@ -7,7 +7,7 @@ import os
 import time
 import json
 from datetime import datetime
-from ncbi_sequence_fetcher import NCBISequenceFetcher
+from ncbi_sequence_fetcher import get_fetcher
 
 class NCBIBulkFetcher:
     """Class for handling bulk NCBI sequence downloads from Excel files"""
@@ -15,7 +15,7 @@ class NCBIBulkFetcher:
     def __init__(self, email):
         """Initialize with user email for NCBI API"""
         self.email = email
-        self.fetcher = NCBISequenceFetcher(email)
+        self.fetcher = get_fetcher(email)
         self.results = []
         self.failed_genes = []
         self.progress_callback = None
@@ -141,6 +141,9 @@ class NCBIBulkFetcher:
         # Create a summary file
         summary_file = os.path.join(output_dir, f"bulk_download_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         
+        # Best search result for each gene; the sequences are downloaded together afterwards
+        found = []
+        
         for i, gene_info in enumerate(gene_list):
             if self.should_stop:
                 print("Bulk processing stopped by user")
@@ -175,61 +178,7 @@ class NCBIBulkFetcher:
                     best_result = search_results[0]  # Fallback to first result
                 
                 print(f"  Found: {best_result['accession']} - {best_result['title'][:50]}...")
-                
-                # Download the sequence with retries
-                download_success = False
-                retry_count = 0
-                
-                while retry_count < max_retries and not download_success:
-                    try:
-                        filepath = self.fetcher.download_sequence(
-                            best_result['id'], 
-                            seq_length, 
-                            output_dir,
-                            gene_name
-                        )
-                        
-                        if filepath:
-                            print(f"  Downloaded to: {filepath}")
-                            
-                            # Record successful download
-                            result_info = {
-                                'gene_info': gene_info,
-                                'search_result': best_result,
-                                'filepath': filepath,
-                                'download_time': datetime.now().isoformat(),
-                                'seq_length_requested': seq_length
-                            }
-                            
-                            self.results.append(result_info)
-                            successful_downloads += 1
-                            download_success = True
-                            
-                        else:
-                            retry_count += 1
-                            print(f"  Download failed, retry {retry_count}/{max_retries}")
-                            
-                    except Exception as download_error:
-                        retry_count += 1
-                        print(f"  Download error (retry {retry_count}/{max_retries}): {download_error}")
-                        
-                        if retry_count >= max_retries:
-                            self.failed_genes.append({
-                                'gene_info': gene_info,
-                                'search_result': best_result,
-                                'error': str(download_error),
-                                'retry_count': retry_count
-                            })
-                
-                if not download_success:
-                    print(f"  Failed to download {gene_name} after {max_retries} attempts")
-                    if not any(f['gene_info']['gene_name'] == gene_name for f in self.failed_genes):
-                        self.failed_genes.append({
-                            'gene_info': gene_info,
-                            'search_result': best_result,
-                            'error': 'Download failed after retries',
-                            'retry_count': max_retries
-                        })
+                found.append((gene_info, best_result))
                 
             except Exception as e:
                 print(f"  Error processing {gene_name}: {e}")
@@ -243,6 +192,31 @@ class NCBIBulkFetcher:
             if i < total_genes - 1:  # Don't delay after the last request
                 time.sleep(delay_between_requests)
         
+        # Download all found sequences with batched efetch requests instead of one per gene
+        if self.progress_callback:
+            self.progress_callback(total_genes, total_genes, f"Downloading {len(found)} sequences")
+        downloaded = self._download_found(found, output_dir, seq_length, max_retries)
+        
+        for gene_info, best_result in found:
+            filepath = downloaded.get(best_result['accession'])
+            if filepath:
+                self.results.append({
+                    'gene_info': gene_info,
+                    'search_result': best_result,
+                    'filepath': filepath,
+                    'download_time': datetime.now().isoformat(),
+                    'seq_length_requested': seq_length
+                })
+                successful_downloads += 1
+            else:
+                print(f"  Failed to download {gene_info['gene_name']} after {max_retries} attempts")
+                self.failed_genes.append({
+                    'gene_info': gene_info,
+                    'search_result': best_result,
+                    'error': 'Download failed after retries',
+                    'retry_count': max_retries
+                })
+        
         # Save summary
         summary = {
             'timestamp': datetime.now().isoformat(),
@@ -292,6 +266,7 @@ class NCBIBulkFetcher:
             # Retry failed downloads
             retry_results = []
             still_failed = []
+            found = []  # (failed gene entry, new best search result)
             
             for i, failed_gene in enumerate(failed_genes):
                 if self.should_stop:
@@ -307,32 +282,14 @@ class NCBIBulkFetcher:
                 print(f"Retrying {i+1}/{len(failed_genes)}: {gene_name}")
                 
                 try:
-                    # Search again
+                    # Search again; the downloads are batched after all searches
                     search_results = self.fetcher.search_gene(organism, gene_name)
                     
                     if search_results:
                         best_result = self.fetcher.find_mane_select(organism, gene_name)
                         if not best_result:
                             best_result = search_results[0]
-                        
-                        # Try download
-                        filepath = self.fetcher.download_sequence(
-                            best_result['id'], 
-                            previous_summary.get('seq_length_requested', 0), 
-                            output_dir
-                        )
-                        
-                        if filepath:
-                            print(f"  Retry successful: {filepath}")
-                            retry_results.append({
-                                'gene_info': gene_info,
-                                'search_result': best_result,
-                                'filepath': filepath,
-                                'download_time': datetime.now().isoformat(),
-                                'retry_attempt': True
-                            })
-                        else:
-                            still_failed.append(failed_gene)
+                        found.append((failed_gene, best_result))
                     else:
                         still_failed.append(failed_gene)
                         
@@ -343,6 +300,26 @@ class NCBIBulkFetcher:
                 
                 time.sleep(1.0)  # Delay between retry requests
             
+            seq_length = previous_summary.get('seq_length_requested', 0)
+            downloaded = self._download_found(
+                [(failed_gene['gene_info'], best_result) for failed_gene, best_result in found],
+                output_dir, seq_length, max_retries
+            )
+            
+            for failed_gene, best_result in found:
+                filepath = downloaded.get(best_result['accession'])
+                if filepath:
+                    print(f"  Retry successful: {filepath}")
+                    retry_results.append({
+                        'gene_info': failed_gene['gene_info'],
+                        'search_result': best_result,
+                        'filepath': filepath,
+                        'download_time': datetime.now().isoformat(),
+                        'retry_attempt': True
+                    })
+                else:
+                    still_failed.append(failed_gene)
+            
             # Update summary
             updated_summary = previous_summary.copy()
             updated_summary['retry_timestamp'] = datetime.now().isoformat()
@@ -364,6 +341,42 @@ class NCBIBulkFetcher:
             print(f"Error during retry: {e}")
             raise e
     
+    def _download_found(self, found, output_dir, seq_length, max_retries):
+        """Download the sequences of found genes with batched efetch requests
+        
+        Accessions missing from a response are requested again, up to
+        max_retries attempts in total.
+        
+        Args:
+            found (list): (gene_info, search_result) pairs
+            output_dir (str): Directory to save sequences
+            seq_length (int): Number of bases to download (0 = full length)
+            max_retries (int): Maximum number of download attempts
+            
+        Returns:
+            dict: Accession -> path of the saved file
+        """
+        downloaded = {}
+        for attempt in range(1, max_retries + 1):
+            if self.should_stop:
+                break
+            
+            # Gene name of the first gene for each accession still missing
+            missing = {}
+            for gene_info, search_result in found:
+                if search_result['accession'] not in downloaded:
+                    missing.setdefault(search_result['accession'], gene_info['gene_name'])
+            if not missing:
+                break
+            
+            if attempt > 1:
+                print(f"Retrying {len(missing)} missing downloads (attempt {attempt}/{max_retries})")
+            downloaded.update(self.fetcher.download_sequences(
+                list(missing), list(missing.values()), output_dir, seq_length
+            ))
+        
+        return downloaded
+    
     def get_results_summary(self):
         """Get a summary of the current results
         
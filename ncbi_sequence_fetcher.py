@@ -1,47 +1,142 @@
-from Bio import Entrez, SeqIO
 import re
 import os
 import sys
+import json
+import functools
+import random
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import pandas as pd
+
+# Base URL for the NCBI E-utilities HTTP API
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+# Size of the chunks streamed from efetch to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Maximum number of IDs sent in one batched efetch request
+EFETCH_BATCH_SIZE = 100
+
+# Characters that are not allowed in Windows file names
+_UNSAFE_CHARS = re.compile(r'[\\/*?:"<>|]')
+# Accession at the start of a FASTA header line
+_ACCESSION_RE = re.compile(r'>(\S+)')
+
+
+class _ReportingRetry(Retry):
+    """Retry policy with jittered backoff that prints each retry so slow NCBI
+    responses are visible"""
+    
+    def get_backoff_time(self):
+        # Spread retries from concurrent workers so they don't hit NCBI in lockstep
+        return super().get_backoff_time() * random.uniform(0.5, 1.5)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        reason = f"HTTP {response.status}" if response is not None else error
+        print(f"NCBI request failed ({reason}), retrying (attempt {len(retry.history)})...")
+        return retry
+
 
 class NCBISequenceFetcher:
     """Class for handling NCBI sequence searches and downloads"""
     
-    def __init__(self, email):
-        """Initialize with user email for NCBI API"""
+    def __init__(self, email, api_key=None):
+        """Initialize with user email (and optional API key) for NCBI API
+        
+        The email and API key are sent with every E-utilities request rather
+        than being stored in module-global state, so several fetchers can be
+        used from different threads safely.
+        """
         self.email = email
-        Entrez.email = email
+        self.api_key = api_key
+        self.session = requests.Session()
+        # E-utilities responses are compressed on the wire and decompressed
+        # transparently by requests
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        # Retry rate-limited (429) and transient server errors with
+        # exponential backoff, honoring any Retry-After header
+        retry = _ReportingRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            allowed_methods=["GET"]
+        )
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+    
+    def _eutils_get(self, utility, params, stream=False):
+        """Send a GET request to an E-utilities endpoint
+        
+        Args:
+            utility: E-utility name (e.g. "esearch", "esummary", "efetch")
+            params: Query parameters for the request
+            stream: If True, defer downloading the body until it is iterated
+            
+        Returns:
+            requests.Response for the completed request
+        """
+        params = dict(params, email=self.email)
+        if self.api_key:
+            params["api_key"] = self.api_key
+        response = self.session.get(f"{EUTILS_BASE_URL}{utility}.fcgi", params=params,
+                                    timeout=30, stream=stream)
+        response.raise_for_status()
+        return response
+    
+    def _esearch(self, term, retmax):
+        """Run an esearch query on the nucleotide database and return the ID list"""
+        response = self._eutils_get("esearch", {
+            "db": "nucleotide",
+            "term": term,
+            "retmax": retmax,
+            "retmode": "json"
+        })
+        return json.loads(response.text)["esearchresult"]["idlist"]
+    
+    def _esummary(self, id_list):
+        """Fetch document summaries for a list of nucleotide IDs
+        
+        The JSON esummary schema uses lowercase keys ("caption", "title",
+        "slen", "uid") and keys each document by its UID.
+        """
+        response = self._eutils_get("esummary", {
+            "db": "nucleotide",
+            "id": ",".join(id_list),
+            "retmode": "json"
+        })
+        result = json.loads(response.text)["result"]
+        return [result[uid] for uid in result.get("uids", [])]
         
     def search_gene_mane_select(self, gene_name, organism="homo sapiens"):
         """Search specifically for MANE Select sequences"""
+        gene_pattern = re.compile(re.escape(gene_name), re.IGNORECASE)
+        
         try:
             # First, try direct MANE Select search
             mane_search_term = f'"{gene_name}"[Gene Name] AND "MANE Select"[Filter] AND "{organism}"[Organism]'
             print(f"Searching for MANE Select with: {mane_search_term}")
             
-            handle = Entrez.esearch(db="nucleotide", term=mane_search_term, retmax=5)
-            record = Entrez.read(handle)
-            handle.close()
+            id_list = self._esearch(mane_search_term, retmax=5)
             
-            if record["IdList"]:
+            if id_list:
                 # Get summaries for MANE Select results
-                handle = Entrez.esummary(db="nucleotide", id=",".join(record["IdList"]))
-                summaries = Entrez.read(handle)
-                handle.close()
+                summaries = self._esummary(id_list)
                 
                 # Format MANE Select results
                 mane_results = []
                 for summary in summaries:
-                    accession = summary.get("Caption", "Unknown")
-                    title = summary.get("Title", "Unknown")
-                    length = summary.get("Length", 0)
+                    accession = summary.get("caption", "Unknown")
+                    title = summary.get("title", "Unknown")
+                    length = summary.get("slen", 0)
                     
                     # Verify this is actually MANE Select
                     is_mane = "MANE Select" in title or "MANE_Select" in title
-                    is_refseq = re.match(r"NM_", accession) is not None
+                    is_refseq = accession.startswith("NM_")
                     
-                    if is_mane or (is_refseq and gene_name.upper() in title.upper()):
+                    if is_mane or (is_refseq and gene_pattern.search(title)):
                         mane_results.append({
-                            "id": summary["Id"],
+                            "id": summary["uid"],
                             "accession": accession,
                             "title": title,
                             "length": length,
@@ -60,6 +155,63 @@ class NCBISequenceFetcher:
         # If MANE Select search fails, return empty list
         return []
     
+    @staticmethod
+    def _score_summaries(summaries, gene_name, min_score=30):
+        """Score esummary records by relevance in a single vectorized pass
+        
+        Args:
+            summaries: List of esummary JSON documents
+            gene_name: Gene name expected in the record title
+            min_score: Minimum relevance score for a record to be kept
+            
+        Returns:
+            List of result dictionaries with relevance_score >= min_score,
+            in the original summary order
+        """
+        if not summaries:
+            return []
+        
+        df = pd.DataFrame(summaries, columns=["uid", "caption", "title", "slen"])
+        df = df.fillna({"caption": "Unknown", "title": "Unknown", "slen": 0})
+        
+        prefix = df["caption"].str.slice(0, 3)
+        is_refseq = prefix == "NM_"
+        is_predicted = prefix == "XM_"
+        is_mane = df["title"].str.contains("MANE[ _]Select", regex=True)
+        gene_in_title = df["title"].str.contains(gene_name, case=False, regex=False)
+        
+        # Same priority cascade as before: MANE > RefSeq > Predicted
+        scores = np.select(
+            [is_mane, is_refseq & gene_in_title, is_refseq, is_predicted & gene_in_title, is_predicted],
+            [100, 80, 50, 30, 10],
+            default=0
+        )
+        keep = scores >= min_score
+        
+        # Convert back to plain Python values so results stay JSON serializable
+        return [
+            {
+                "id": uid,
+                "accession": accession,
+                "title": title,
+                "length": length,
+                "is_mane": mane,
+                "is_refseq": refseq,
+                "is_predicted": predicted,
+                "relevance_score": score
+            }
+            for uid, accession, title, length, mane, refseq, predicted, score in zip(
+                df["uid"][keep].tolist(),
+                df["caption"][keep].tolist(),
+                df["title"][keep].tolist(),
+                df["slen"][keep].tolist(),
+                is_mane[keep].tolist(),
+                is_refseq[keep].tolist(),
+                is_predicted[keep].tolist(),
+                scores[keep].tolist()
+            )
+        ]
+    
     def search_gene(self, organism, gene_name):
         """Search for gene sequences in NCBI with improved strategy"""
         all_results = []
@@ -67,65 +219,28 @@ class NCBISequenceFetcher:
         # Strategy 1: Try MANE Select first
         mane_results = self.search_gene_mane_select(gene_name, organism)
         all_results.extend(mane_results)
+        seen_accessions = {result["accession"] for result in mane_results}
         
         # Strategy 2: Gene-specific search
         try:
             gene_search_term = f'"{gene_name}"[Gene Name] AND "{organism}"[Organism] AND "mRNA"[Filter]'
             print(f"Searching with gene-specific query: {gene_search_term}")
             
-            handle = Entrez.esearch(db="nucleotide", term=gene_search_term, retmax=10)
-            record = Entrez.read(handle)
-            handle.close()
+            id_list = self._esearch(gene_search_term, retmax=10)
             
-            if record["IdList"]:
+            if id_list:
                 # Get summaries for gene results
-                handle = Entrez.esummary(db="nucleotide", id=",".join(record["IdList"]))
-                summaries = Entrez.read(handle)
-                handle.close()
+                summaries = self._esummary(id_list)
                 
-                # Process gene search results
-                for summary in summaries:
-                    accession = summary.get("Caption", "Unknown")
-                    title = summary.get("Title", "Unknown")
-                    length = summary.get("Length", 0)
-                    
+                # Score gene search results and keep the relevant ones
+                for result in self._score_summaries(summaries, gene_name):
                     # Skip if we already have this sequence from MANE search
-                    if any(result["accession"] == accession for result in all_results):
+                    if result["accession"] in seen_accessions:
                         continue
                     
-                    # Check if this is a MANE Select entry
-                    is_mane = "MANE Select" in title or "MANE_Select" in title
-                    is_refseq = re.match(r"NM_", accession) is not None
-                    is_predicted = re.match(r"XM_", accession) is not None
-                    
-                    # Calculate relevance score
-                    relevance_score = 0
-                    gene_in_title = gene_name.upper() in title.upper()
-                    
-                    if is_mane:
-                        relevance_score += 100
-                    elif is_refseq and gene_in_title:
-                        relevance_score += 80
-                    elif is_refseq:
-                        relevance_score += 50
-                    elif is_predicted and gene_in_title:
-                        relevance_score += 30
-                    elif is_predicted:
-                        relevance_score += 10
-                    
-                    # Only include if relevance is reasonable
-                    if relevance_score >= 30:
-                        all_results.append({
-                            "id": summary["Id"],
-                            "accession": accession,
-                            "title": title,
-                            "length": length,
-                            "is_mane": is_mane,
-                            "is_refseq": is_refseq,
-                            "is_predicted": is_predicted,
-                            "relevance_score": relevance_score
-                        })
-                        print(f"  Found: {accession} (score: {relevance_score}) - {title[:60]}...")
+                    all_results.append(result)
+                    seen_accessions.add(result["accession"])
+                    print(f"  Found: {result['accession']} (score: {result['relevance_score']}) - {result['title'][:60]}...")
                         
         except Exception as e:
             print(f"Gene search failed: {e}")
@@ -136,31 +251,27 @@ class NCBISequenceFetcher:
                 broad_search_term = f"{organism} {gene_name} mRNA"
                 print(f"Fallback broad search: {broad_search_term}")
                 
-                handle = Entrez.esearch(db="nucleotide", term=broad_search_term, retmax=5)
-                record = Entrez.read(handle)
-                handle.close()
+                id_list = self._esearch(broad_search_term, retmax=5)
                 
-                if record["IdList"]:
-                    handle = Entrez.esummary(db="nucleotide", id=",".join(record["IdList"]))
-                    summaries = Entrez.read(handle)
-                    handle.close()
+                if id_list:
+                    summaries = self._esummary(id_list)
                     
                     for summary in summaries:
-                        accession = summary.get("Caption", "Unknown")
-                        title = summary.get("Title", "Unknown")
-                        length = summary.get("Length", 0)
+                        accession = summary.get("caption", "Unknown")
+                        title = summary.get("title", "Unknown")
+                        length = summary.get("slen", 0)
                         
                         is_mane = "MANE Select" in title
-                        is_refseq = re.match(r"NM_", accession) is not None
+                        is_refseq = accession.startswith("NM_")
                         
                         all_results.append({
-                            "id": summary["Id"],
+                            "id": summary["uid"],
                             "accession": accession,
                             "title": title,
                             "length": length,
                             "is_mane": is_mane,
                             "is_refseq": is_refseq,
-                            "is_predicted": re.match(r"XM_", accession) is not None,
+                            "is_predicted": accession.startswith("XM_"),
                             "relevance_score": 20 if is_refseq else 10
                         })
                         
@@ -190,14 +301,58 @@ class NCBISequenceFetcher:
         
         return best_result
     
-    def download_sequence(self, seq_id, seq_length=0, output_dir=".", gene_name=None):
+    @staticmethod
+    def _fasta_filename(header, seq_id, seq_length=0, gene_name=None):
+        """Build a Windows-safe FASTA filename from a header line
+        
+        Args:
+            header: FASTA header line as bytes (">accession description")
+            seq_id: Requested ID, used when no accession can be parsed
+            seq_length: Number of bases requested (0 = full length)
+            gene_name: Gene name to include in filename
+            
+        Returns:
+            Filename (without directory) for the sequence
+        """
+        # Extract accession from the first line of the FASTA
+        first_line = header.decode('utf-8', errors='replace')
+        accession_match = _ACCESSION_RE.search(first_line)
+        if accession_match:
+            raw_accession = accession_match.group(1)
+            # Clean the accession for safe file naming
+            accession = _UNSAFE_CHARS.sub('_', raw_accession)
+            print(f"Extracted accession: {raw_accession}")
+            print(f"Cleaned for filename: {accession}")
+        else:
+            accession = f"sequence_{seq_id}"
+            print(f"Could not extract accession, using: {accession}")
+        
+        # Create a Windows-safe filename with gene name
+        if gene_name:
+            # Clean gene name for safe file naming
+            safe_gene_name = _UNSAFE_CHARS.sub('_', gene_name)
+            if seq_length > 0:
+                return f"{accession}_{seq_length}bp_{safe_gene_name}.fasta"
+            return f"{accession}_full_{safe_gene_name}.fasta"
+        
+        # Fallback to original naming if no gene name provided
+        if seq_length > 0:
+            return f"{accession}_{seq_length}bp.fasta"
+        return f"{accession}_full.fasta"
+    
+    def download_sequence(self, seq_id, seq_length=0, output_dir=".", gene_name=None,
+                          rettype="fasta", idtype="acc"):
         """Download sequence and save to file
         
         Args:
-            seq_id: NCBI sequence ID
+            seq_id: NCBI sequence ID or accession (e.g. "NM_000546")
             seq_length: Number of bases to download (0 = full length)
             output_dir: Directory to save the file
             gene_name: Gene name to include in filename
+            rettype: efetch return type; use "fasta_cds_na" to fetch only the
+                coding sequence instead of the full record
+            idtype: Identifier type reported in the FASTA header ("acc"
+                returns accession.version identifiers)
             
         Returns:
             Path to the saved file or None if error
@@ -209,8 +364,9 @@ class NCBISequenceFetcher:
             params = {
                 "db": "nucleotide",
                 "id": seq_id,
-                "rettype": "fasta",
-                "retmode": "text"
+                "rettype": rettype,
+                "retmode": "text",
+                "idtype": idtype
             }
             
             # Add sequence length limits if specified
@@ -218,48 +374,34 @@ class NCBISequenceFetcher:
                 params["seq_start"] = 1
                 params["seq_stop"] = seq_length
             
-            print(f"Using Entrez.efetch with params: {params}")
+            print(f"Using efetch with params: {params}")
             
-            # Fetch the sequence
-            handle = Entrez.efetch(**params)
-            sequence_data = handle.read()
-            handle.close()
+            # Stream the sequence; only the first chunk is held in memory
+            response = self._eutils_get("efetch", params, stream=True)
+            chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+            first_chunk = next(chunks, b"")
+            
+            # Narrower return types are not available for every record; NCBI
+            # answers with an error message instead of FASTA in that case
+            if rettype != "fasta" and not first_chunk.startswith(b">"):
+                print(f"rettype '{rettype}' returned no FASTA data, falling back to 'fasta'")
+                response.close()
+                params["rettype"] = "fasta"
+                response = self._eutils_get("efetch", params, stream=True)
+                chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                first_chunk = next(chunks, b"")
             
             # Debug: Check what we received
-            print(f"Received data length: {len(sequence_data)} bytes")
-            print(f"First 100 characters: {sequence_data[:100]}")
+            print(f"First 100 characters: {first_chunk[:100].decode('utf-8', errors='replace')}")
             
-            if not sequence_data:
+            if not first_chunk:
                 print("No sequence data received")
+                response.close()
                 return None
             
-            # Extract accession from the first line of the FASTA
-            first_line = sequence_data.split('\n')[0]
-            accession_match = re.search(r'>(\S+)', first_line)
-            if accession_match:
-                raw_accession = accession_match.group(1)
-                # Clean the accession for safe file naming
-                accession = re.sub(r'[\\/*?:"<>|]', '_', raw_accession)
-                print(f"Extracted accession: {raw_accession}")
-                print(f"Cleaned for filename: {accession}")
-            else:
-                accession = f"sequence_{seq_id}"
-                print(f"Could not extract accession, using: {accession}")
-            
-            # Create a Windows-safe filename with gene name
-            if gene_name:
-                # Clean gene name for safe file naming
-                safe_gene_name = re.sub(r'[\\/*?:"<>|]', '_', gene_name)
-                if seq_length > 0:
-                    filename = f"{accession}_{seq_length}bp_{safe_gene_name}.fasta"
-                else:
-                    filename = f"{accession}_full_{safe_gene_name}.fasta"
-            else:
-                # Fallback to original naming if no gene name provided
-                if seq_length > 0:
-                    filename = f"{accession}_{seq_length}bp.fasta"
-                else:
-                    filename = f"{accession}_full.fasta"
+            # Build a Windows-safe filename from the FASTA header
+            header, _, _ = first_chunk.partition(b'\n')
+            filename = self._fasta_filename(header, seq_id, seq_length, gene_name)
             
             # Create the full filepath
             filepath = os.path.join(output_dir, filename)
@@ -270,14 +412,17 @@ class NCBISequenceFetcher:
             
             # Write the file with explicit binary mode
             with open(filepath, "wb") as outfile:
-                outfile.write(sequence_data.encode('utf-8'))
+                outfile.write(first_chunk)
+                for chunk in chunks:
+                    outfile.write(chunk)
+                filesize = outfile.tell()
+            response.close()
             
             # Verify file was written correctly
-            if os.path.getsize(filepath) == 0:
+            if filesize == 0:
                 print("Failed to write sequence data to file (file is empty)")
                 return None
             else:
-                filesize = os.path.getsize(filepath)
                 print(f"File written successfully: {filesize} bytes")
                 
             return filepath
@@ -286,4 +431,156 @@ class NCBISequenceFetcher:
             print(f"Error downloading sequence: {str(e)}")
             import traceback
             traceback.print_exc()
-            return None
\ No newline at end of file
+            return None
+    
+    def download_sequences(self, seq_ids, gene_names=None, output_dir=".", seq_length=0,
+                           batch_size=EFETCH_BATCH_SIZE):
+        """Download several sequences with one efetch request per batch
+        
+        efetch accepts a comma-separated ID list and returns a multi-FASTA
+        response, which is split into one file per record while streaming.
+        
+        Args:
+            seq_ids: NCBI sequence IDs or accessions
+            gene_names: Gene names matching seq_ids by position (optional).
+                Each returned record is matched to its requested ID by the
+                accession in its header, since efetch silently drops invalid
+                IDs and merges duplicates.
+            output_dir: Directory to save the files
+            seq_length: Number of bases to download per sequence (0 = full length)
+            batch_size: Maximum number of IDs sent in a single efetch request
+            
+        Returns:
+            Dict mapping each requested ID that was downloaded to its saved file.
+            Records that match no requested ID are still saved but not listed.
+        """
+        seq_ids = list(seq_ids)
+        gene_names = list(gene_names) if gene_names else [None] * len(seq_ids)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        filepaths = {}
+        for start in range(0, len(seq_ids), batch_size):
+            batch_ids = seq_ids[start:start + batch_size]
+            batch_gene_names = gene_names[start:start + batch_size]
+            print(f"Downloading batch of {len(batch_ids)} sequences starting at {batch_ids[0]}")
+            
+            try:
+                filepaths.update(self._download_batch(batch_ids, batch_gene_names, output_dir, seq_length))
+            except Exception as e:
+                print(f"Error downloading batch starting at {batch_ids[0]}: {str(e)}")
+        
+        print(f"Downloaded {len(filepaths)} of {len(seq_ids)} sequences")
+        return filepaths
+    
+    @staticmethod
+    def _match_record(header, requested):
+        """Find the requested ID a multi-FASTA record belongs to
+        
+        Args:
+            header: FASTA header line as bytes (">accession[:range] description")
+            requested: Mapping of requested ID, with and without version,
+                to (ID, gene name)
+            
+        Returns:
+            (ID, gene name) of the matching request, or (None, None)
+        """
+        accession_match = _ACCESSION_RE.search(header.decode('utf-8', errors='replace'))
+        if not accession_match:
+            return None, None
+        
+        # Ranged downloads report the accession as "NM_000546.6:1-1000"
+        accession = accession_match.group(1).split(":")[0]
+        match = requested.get(accession) or requested.get(accession.split(".")[0])
+        return match if match else (None, None)
+    
+    def _download_batch(self, seq_ids, gene_names, output_dir, seq_length):
+        """Fetch one batch of sequences and split the multi-FASTA into files
+        
+        Returns:
+            Dict mapping requested IDs to the files their records were saved to
+        """
+        params = {
+            "db": "nucleotide",
+            "id": ",".join(str(seq_id) for seq_id in seq_ids),
+            "rettype": "fasta",
+            "retmode": "text",
+            "idtype": "acc"
+        }
+        if seq_length > 0:
+            params["seq_start"] = 1
+            params["seq_stop"] = seq_length
+        
+        # Requested ID (with and without version) -> (ID, gene name)
+        requested = {}
+        for seq_id, gene_name in zip(seq_ids, gene_names):
+            seq_id = str(seq_id)
+            requested.setdefault(seq_id, (seq_id, gene_name))
+            requested.setdefault(seq_id.split(".")[0], (seq_id, gene_name))
+        
+        response = self._eutils_get("efetch", params, stream=True)
+        filepaths = {}
+        outfile = None
+        record_index = -1
+        pending = b""
+        
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                data = pending + chunk
+                pending = b""
+                
+                while data:
+                    if outfile is None:
+                        # A new record starts here; wait for its complete header line
+                        if not data.startswith(b">"):
+                            raise ValueError(f"Unexpected efetch response: {data[:100]!r}")
+                        header_end = data.find(b"\n")
+                        if header_end == -1:
+                            pending = data
+                            break
+                        
+                        record_index += 1
+                        seq_id, gene_name = self._match_record(data[:header_end], requested)
+                        fallback_id = seq_id if seq_id is not None else f"record{record_index}"
+                        filename = self._fasta_filename(data[:header_end], fallback_id, seq_length, gene_name)
+                        filepath = os.path.join(output_dir, filename)
+                        outfile = open(filepath, "wb")
+                        if seq_id is not None:
+                            filepaths[seq_id] = filepath
+                        else:
+                            print(f"Record {record_index} matched no requested ID, saved as {filename}")
+                    
+                    # Records are separated by a header at the start of a line
+                    boundary = data.find(b"\n>")
+                    if boundary == -1:
+                        # Hold back a trailing newline in case the next chunk starts a record
+                        if data.endswith(b"\n"):
+                            outfile.write(data[:-1])
+                            pending = b"\n"
+                        else:
+                            outfile.write(data)
+                        break
+                    
+                    outfile.write(data[:boundary + 1])
+                    outfile.close()
+                    outfile = None
+                    data = data[boundary + 1:]
+            
+            if outfile is not None and pending:
+                outfile.write(pending)
+        finally:
+            if outfile is not None:
+                outfile.close()
+            response.close()
+        
+        return filepaths
+
+
+@functools.lru_cache(maxsize=1)
+def get_fetcher(email, api_key=None):
+    """Return a shared NCBISequenceFetcher for the given credentials
+    
+    Reusing one fetcher lets every search and download share the same
+    HTTP session and connection pool. A new fetcher is created only when
+    the email or API key changes.
+    """
+    return NCBISequenceFetcher(email, api_key)
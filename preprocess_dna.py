@@ -5,9 +5,266 @@ with bulk FASTA file processing and ROI extraction
 import re
 import os
 import json
+import mmap
+import logging
+import logging.handlers
+import functools
+import multiprocessing
+import numpy as np
 import pandas as pd
-from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Union
+from excel_export import write_excel_constant_memory
+
+logger = logging.getLogger(__name__)
+
+# Translation tables for complementing DNA; other characters are left unchanged
+_COMPLEMENT_TABLE = str.maketrans("ACGTacgtNn", "TGCAtgcaNn")
+_COMPLEMENT_TABLE_BYTES = bytes.maketrans(b"ACGTacgtNn", b"TGCAtgcaNn")
+
+# FASTA header lines and the whitespace removed when joining sequence lines
+_HEADER_RE = re.compile(r'(?m)^>[^\n]*\n?')
+_WS_TABLE = str.maketrans('', '', ' \t\r\n')
+_HEADER_RE_BYTES = re.compile(rb'(?m)^>[^\n]*\n?')
+_WS_BYTES = b' \t\r\n'
+
+# FASTA output line width, and how many bases save_fasta wraps per write
+# (a whole number of lines, about 1 MiB)
+_FASTA_LINE_WIDTH = 60
+_FASTA_SLAB_SIZE = _FASTA_LINE_WIDTH * 17476
+
+# Filename patterns used by parse_filename: an accession prefix such as
+# "NM_023112.4_", a bare accession, and a leading "full"/"2100bp" descriptor
+_ACCESSION_PREFIX_RE = re.compile(r'^([A-Z]{1,3}_[0-9]+(?:\.[0-9]+)?)_')
+_ACCESSION_RE = re.compile(r'^[A-Z]{1,3}_[0-9]+(?:\.[0-9]+)?$')
+_DESCRIPTOR_RE = re.compile(r'^(full|[0-9]+bp)_?')
+
+# Longest ROI scanned with the unrolled numpy compare, and its block size in bytes
+_UNROLLED_SCAN_MAX = 8
+_SCAN_BLOCK_SIZE = 1 << 22
+
+# Bases of context kept on each side of an ROI hit in the directory summary
+_ROI_CONTEXT_SIZE = 10
+
+# Directories with fewer FASTA files than this are scanned in-process; below
+# it, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+# Columns of the process_fasta_directory summary; rows are tuples in this order
+_SUMMARY_COLUMNS = ['gene_name', 'accession_number', 'species', 'status', 'found_roi', 'roi_locus', 'gene']
+
+# Standard genetic code
+_GENETIC_CODE = {
+    'ATA': 'I', 'ATC': 'I', 'ATT': 'I', 'ATG': 'M',
+    'ACA': 'T', 'ACC': 'T', 'ACG': 'T', 'ACT': 'T',
+    'AAC': 'N', 'AAT': 'N', 'AAA': 'K', 'AAG': 'K',
+    'AGC': 'S', 'AGT': 'S', 'AGA': 'R', 'AGG': 'R',
+    'CTA': 'L', 'CTC': 'L', 'CTG': 'L', 'CTT': 'L',
+    'CCA': 'P', 'CCC': 'P', 'CCG': 'P', 'CCT': 'P',
+    'CAC': 'H', 'CAT': 'H', 'CAA': 'Q', 'CAG': 'Q',
+    'CGA': 'R', 'CGC': 'R', 'CGG': 'R', 'CGT': 'R',
+    'GTA': 'V', 'GTC': 'V', 'GTG': 'V', 'GTT': 'V',
+    'GCA': 'A', 'GCC': 'A', 'GCG': 'A', 'GCT': 'A',
+    'GAC': 'D', 'GAT': 'D', 'GAA': 'E', 'GAG': 'E',
+    'GGA': 'G', 'GGC': 'G', 'GGG': 'G', 'GGT': 'G',
+    'TCA': 'S', 'TCC': 'S', 'TCG': 'S', 'TCT': 'S',
+    'TTC': 'F', 'TTT': 'F', 'TTA': 'L', 'TTG': 'L',
+    'TAC': 'Y', 'TAT': 'Y', 'TAA': '*', 'TAG': '*',
+    'TGC': 'C', 'TGT': 'C', 'TGA': '*', 'TGG': 'W',
+}
+
+# Base -> 2-bit code lookup (A=0, C=1, G=2, T=3, case-insensitive);
+# every other byte maps to _UNKNOWN_BASE
+_UNKNOWN_BASE = 0b100
+_BASE_TO_2BIT = bytes(
+    "ACGT".find(chr(b).upper()) if chr(b).upper() in "ACGT" else _UNKNOWN_BASE
+    for b in range(256)
+)
+
+# Amino acid for each 6-bit codon index (b0 << 4 | b1 << 2 | b2)
+_CODON_TABLE = bytes(
+    ord(_GENETIC_CODE[a + b + c]) for a in "ACGT" for b in "ACGT" for c in "ACGT"
+)
+_UNKNOWN_AMINO_ACID = ord('X')
+_STOP_CODON = ord('*')
+
+# 2-bit packed DNA (4 bases per byte, first base in the high bits): base for
+# each code, and a table reversing the order of the four bases in a byte
+_2BIT_TO_BASE = np.frombuffer(b"ACGT", dtype=np.uint8)
+_REVERSE_2BIT_LUT = np.array(
+    [((b & 3) << 6) | (((b >> 2) & 3) << 4) | (((b >> 4) & 3) << 2) | (b >> 6) for b in range(256)],
+    dtype=np.uint8
+)
+
+
+def _find_all_positions(sequence: Union[str, bytes], pattern: Union[str, bytes]) -> List[int]:
+    """Return the start position of every (possibly overlapping) match of pattern
+    
+    Works on str, or on bytes/mmap where find() is a memmem-style byte search.
+    
+    Args:
+        sequence (str or bytes): Sequence to search in
+        pattern (str or bytes): Sequence to find, of the same type
+        
+    Returns:
+        List[int]: Match start positions in ascending order
+    """
+    positions = []
+    if not pattern:
+        return positions
+    
+    find = sequence.find
+    append = positions.append
+    index = find(pattern)
+    while index != -1:
+        append(index)
+        index = find(pattern, index + 1)  # Allow overlapping matches
+    return positions
+
+
+def _encode_roi(roi: str) -> Optional[bytes]:
+    """Encode an ROI for searching raw FASTA bytes
+    
+    The ROI comes from free text in the GUI; a non-ASCII ROI cannot occur in
+    a nucleotide sequence, so it is reported as not found instead of raising.
+    
+    Args:
+        roi (str): Region of Interest sequence
+        
+    Returns:
+        bytes: The ASCII-encoded ROI, or None if it contains non-ASCII characters
+    """
+    try:
+        return roi.encode('ascii')
+    except UnicodeEncodeError:
+        return None
+
+
+def _derive_status(search_result: Dict) -> str:
+    """Map a search result's flags to a sequence status
+    
+    Args:
+        search_result (Dict): 'search_result' entry from the JSON summary
+        
+    Returns:
+        str: Status ("MANE Select+RefSeq", "MANE Select", "RefSeq", "Predicted", "Curated")
+    """
+    if search_result.get('is_mane', False):
+        if search_result.get('is_refseq', False):
+            return "MANE Select+RefSeq"
+        else:
+            return "MANE Select"
+    elif search_result.get('is_refseq', False):
+        return "RefSeq"
+    elif search_result.get('is_predicted', False):
+        return "Predicted"
+    else:
+        return "Curated"
+
+
+def _build_status_map(json_file_path: str) -> Dict[str, str]:
+    """Read a JSON summary file once and index the status of every gene
+    
+    Args:
+        json_file_path (str): Path to JSON summary file
+        
+    Returns:
+        Dict[str, str]: Upper-cased gene name -> status (empty if the file can't be read)
+    """
+    try:
+        with open(json_file_path, 'r') as f:
+            data = json.load(f)
+        
+        status_map = {}
+        for result in data.get('successful_results', []):
+            gene_name = result.get('gene_info', {}).get('gene_name', '')
+            # Keep the first match, like determine_status_from_json
+            status_map.setdefault(gene_name.upper(), _derive_status(result.get('search_result', {})))
+        return status_map
+        
+    except Exception as e:
+        print(f"Error reading JSON file {json_file_path}: {e}")
+        return {}
+
+
+def _iter_sequence_lines(fasta_content: Union[str, bytes]):
+    """Yield the sequence lines of FASTA content one at a time, cleaned like
+    SequenceProcessor.extract_sequence_from_fasta (no headers or whitespace, upper case)
+    
+    Args:
+        fasta_content (str or bytes): Content of a FASTA file
+        
+    Yields:
+        str or bytes: Cleaned sequence line (same type as the content)
+    """
+    is_str = isinstance(fasta_content, str)
+    newline, header = ('\n', '>') if is_str else (b'\n', b'>')
+    
+    start = 0
+    while start < len(fasta_content):
+        end = fasta_content.find(newline, start)
+        if end == -1:
+            end = len(fasta_content)
+        if not fasta_content.startswith(header, start):
+            line = fasta_content[start:end]
+            yield line.translate(_WS_TABLE).upper() if is_str else line.translate(None, _WS_BYTES).upper()
+        start = end + 1
+
+
+@functools.lru_cache(maxsize=32)
+def _make_scanner(roi: bytes):
+    """Build a hit scanner specialized for one ROI
+    
+    ROIs of up to _UNROLLED_SCAN_MAX bytes get a numpy scanner with one
+    vectorized compare per ROI byte and no per-hit Python work; longer ROIs,
+    which rarely hit, use the bytes.find loop.
+    
+    Args:
+        roi (bytes): Region of Interest to find
+        
+    Returns:
+        callable: scanner(sequence) -> List[int] of (overlapping) hit positions
+            in a bytes-like sequence
+    """
+    if not roi or len(roi) > _UNROLLED_SCAN_MAX:
+        return functools.partial(_find_all_positions, pattern=roi)
+    
+    needle = tuple(roi)
+    roi_len = len(roi)
+    
+    def scan(sequence) -> List[int]:
+        data = np.frombuffer(sequence, dtype=np.uint8)
+        positions = []
+        # Scan in blocks (overlapping by roi_len - 1) to bound temporary memory
+        for start in range(0, len(data) - roi_len + 1, _SCAN_BLOCK_SIZE):
+            window = data[start:start + _SCAN_BLOCK_SIZE + roi_len - 1]
+            count = len(window) - roi_len + 1
+            hits = window[:count] == needle[0]
+            for offset in range(1, roi_len):
+                hits &= window[offset:offset + count] == needle[offset]
+            positions.extend((np.flatnonzero(hits) + start).tolist())
+        return positions
+    
+    return scan
+
+
+@functools.lru_cache(maxsize=32)
+def _multi_pattern_scanner(patterns: Tuple[Union[str, bytes], ...]) -> "re.Pattern":
+    """Compile a zero-width regex matching wherever any of the patterns starts
+    
+    Args:
+        patterns (Tuple[str or bytes, ...]): Non-empty literal patterns, all str or all bytes
+        
+    Returns:
+        re.Pattern: Compiled lookahead alternation (overlapping hits are reported);
+            a bytes pattern when the patterns are bytes
+    """
+    if isinstance(patterns[0], bytes):
+        alternation = b'|'.join(re.escape(pattern) for pattern in patterns)
+        return re.compile(b'(?=(?:' + alternation + b'))')
+    alternation = '|'.join(re.escape(pattern) for pattern in patterns)
+    return re.compile(f'(?=(?:{alternation}))')
+
 
 class SequenceProcessor:
     """Class for processing DNA and protein sequences"""
@@ -17,89 +274,104 @@ class SequenceProcessor:
         """Find the first line containing the Region of Interest in FASTA content
         
         Args:
-            fasta_content (str): Content of a FASTA file
+            fasta_content (str or bytes): Content of a FASTA file; bytes are searched
+                without decoding and only the returned subsequence is decoded
             roi (str): Region of Interest sequence to find (default: "CACCTG")
             
         Returns:
             str: Subsequence containing the ROI or None if not found
         """
-        lines = fasta_content.strip().split('\n')
+        is_bytes = not isinstance(fasta_content, str)
+        if is_bytes:
+            roi = _encode_roi(roi)
+            if roi is None:
+                return None
+        context_size = 30  # Nucleotides before and after ROI
         
-        # Skip header lines (start with >)
-        sequence_lines = [line for line in lines if not line.startswith('>')]
+        # Only the last (context + ROI - 1) bases are kept between lines, so a
+        # new hit still has its full upstream context and spans line breaks
+        keep = context_size + len(roi) - 1
+        window = fasta_content[:0]
+        roi_index = -1
         
-        # Combine all sequence lines into one string for easier searching
-        full_sequence = ''.join(sequence_lines)
+        # Stream the cleaned sequence lines, stopping once the ROI and its
+        # downstream context have been read
+        for line in _iter_sequence_lines(fasta_content):
+            window += line
+            if roi_index == -1:
+                roi_index = window.find(roi)
+                if roi_index == -1:
+                    window = window[-keep:]
+                    continue
+            if len(window) >= roi_index + len(roi) + context_size:
+                break
         
-        # Find the ROI
-        roi_index = full_sequence.find(roi)
         if roi_index == -1:
             return None
         
         # Extract a subsequence containing the ROI (include some context around it)
-        context_size = 30  # Nucleotides before and after ROI
         start = max(0, roi_index - context_size)
-        end = min(len(full_sequence), roi_index + len(roi) + context_size)
+        end = min(len(window), roi_index + len(roi) + context_size)
         
-        return full_sequence[start:end]
+        if is_bytes:
+            return window[start:end].decode('ascii', 'replace')
+        return window[start:end]
     
     @staticmethod
-    def find_all_roi_in_sequence(sequence: str, roi: str = "CACCTG", context_size: int = 10) -> List[Dict]:
+    def find_all_roi_in_sequence(sequence: Union[str, bytes], roi: str = "CACCTG",
+                                 context_size: int = 10) -> List[Dict]:
         """Find all occurrences of ROI in a sequence with context
         
         Args:
-            sequence (str): DNA sequence to search in
+            sequence (str or bytes): DNA sequence to search in; bytes are searched
+                without decoding and only the context slices are decoded
             roi (str): Region of Interest sequence to find
             context_size (int): Number of bases before and after ROI to include
             
         Returns:
             List[Dict]: List of dictionaries containing ROI information
         """
+        is_bytes = not isinstance(sequence, str)
+        pattern = _encode_roi(roi) if is_bytes else roi
+        if pattern is None:
+            return []
+        roi_len = len(roi)
+        seq_len = len(sequence)
+        
+        # Collect hit positions first, then build the result dicts in one pass
         roi_occurrences = []
-        start = 0
-        
-        while True:
-            roi_index = sequence.find(roi, start)
-            if roi_index == -1:
-                break
-                
+        positions = _make_scanner(pattern)(sequence) if is_bytes else _find_all_positions(sequence, pattern)
+        for roi_index in positions:
             # Calculate start and end positions with context
             context_start = max(0, roi_index - context_size)
-            context_end = min(len(sequence), roi_index + len(roi) + context_size)
-            
-            # Extract the sequence with context
-            roi_with_context = sequence[context_start:context_end]
+            context_end = min(seq_len, roi_index + roi_len + context_size)
             
             # Create locus string (start_end format) - use actual positions in original sequence
-            roi_locus = f"{context_start}_{context_end-1}"
-            
-            roi_info = {
-                'roi_sequence': roi_with_context,
-                'roi_locus': roi_locus,
+            roi_occurrences.append({
+                'roi_sequence': (sequence[context_start:context_end].decode('ascii', 'replace')
+                                 if is_bytes else sequence[context_start:context_end]),
+                'roi_locus': f"{context_start}_{context_end-1}",
                 'roi_start': roi_index,
-                'roi_end': roi_index + len(roi) - 1,
+                'roi_end': roi_index + roi_len - 1,
                 'context_start': context_start,
                 'context_end': context_end - 1
-            }
-            
-            roi_occurrences.append(roi_info)
-            start = roi_index + 1  # Move past this occurrence
+            })
             
         return roi_occurrences
     
     @staticmethod
-    def extract_sequence_from_fasta(fasta_content: str) -> str:
+    def extract_sequence_from_fasta(fasta_content: Union[str, bytes, mmap.mmap]) -> Union[str, bytes]:
         """Extract the DNA sequence from FASTA content (removes headers)
         
         Args:
-            fasta_content (str): Content of a FASTA file
+            fasta_content (str, bytes or mmap): Content of a FASTA file
             
         Returns:
-            str: Clean DNA sequence
+            str or bytes: Clean DNA sequence (bytes unless the content is a str)
         """
-        lines = fasta_content.strip().split('\n')
-        sequence_lines = [line.strip() for line in lines if not line.startswith('>')]
-        return ''.join(sequence_lines).upper()
+        if isinstance(fasta_content, str):
+            return _HEADER_RE.sub('', fasta_content).translate(_WS_TABLE).upper()
+        return _HEADER_RE_BYTES.sub(b'', fasta_content).translate(None, _WS_BYTES).upper()
     
     @staticmethod
     def parse_filename(filename: str) -> Tuple[str, str]:
@@ -112,13 +384,13 @@ class SequenceProcessor:
             Tuple[str, str]: (accession_number, gene_name)
         """
         # Remove file extension
-        base_name = Path(filename).stem
+        base_name = os.path.splitext(filename)[0]
         
         # Pattern to match: accession_number + optional_descriptor + gene_name
         # Examples: "NM_023112.4_full_SLC22A18" or "XM_054320700.1_2100bp_NWD1"
         
         # First, try to identify accession pattern (starts with letters, has underscore and numbers/dots)
-        accession_match = re.match(r'^([A-Z]{1,3}_[0-9]+(?:\.[0-9]+)?)_', base_name)
+        accession_match = _ACCESSION_PREFIX_RE.match(base_name)
         
         if accession_match:
             accession = accession_match.group(1)
@@ -141,7 +413,7 @@ class SequenceProcessor:
             if len(parts) >= 3:
                 # Try to reconstruct accession from first two parts if they match pattern
                 potential_accession = f"{parts[0]}_{parts[1]}"
-                if re.match(r'^[A-Z]{1,3}_[0-9]+(?:\.[0-9]+)?$', potential_accession):
+                if _ACCESSION_RE.match(potential_accession):
                     accession = potential_accession
                     gene_name = '_'.join(parts[2:])  # Everything after accession
                 else:
@@ -154,7 +426,7 @@ class SequenceProcessor:
                 gene_name = base_name
         
         # Clean up gene name by removing common descriptors
-        gene_name = re.sub(r'^(full|[0-9]+bp)_?', '', gene_name)
+        gene_name = _DESCRIPTOR_RE.sub('', gene_name)
         
         if not gene_name:  # If gene_name is empty after cleaning
             gene_name = accession
@@ -180,19 +452,7 @@ class SequenceProcessor:
             for result in data.get('successful_results', []):
                 result_gene = result.get('gene_info', {}).get('gene_name', '')
                 if result_gene.upper() == gene_name.upper():
-                    search_result = result.get('search_result', {})
-                    
-                    if search_result.get('is_mane', False):
-                        if search_result.get('is_refseq', False):
-                            return "MANE Select+RefSeq"
-                        else:
-                            return "MANE Select"
-                    elif search_result.get('is_refseq', False):
-                        return "RefSeq"
-                    elif search_result.get('is_predicted', False):
-                        return "Predicted"
-                    else:
-                        return "Curated"
+                    return _derive_status(result.get('search_result', {}))
             
             return "Unknown"
             
@@ -202,100 +462,84 @@ class SequenceProcessor:
     
     @staticmethod
     def process_fasta_directory(directory_path: str, roi: str = "CACCTG", 
-                              progress_callback=None) -> pd.DataFrame:
+                              progress_callback=None, max_workers: Optional[int] = None) -> pd.DataFrame:
         """Process all FASTA files in a directory and create summary DataFrame
         
+        Larger directories are scanned in a pool of worker processes, started
+        with the "spawn" method so it is safe to call from a (Qt) thread.
+        
         Args:
             directory_path (str): Path to directory containing FASTA files
             roi (str): Region of Interest sequence to find
             progress_callback: Optional callback function for progress updates
+            max_workers (int): Number of worker processes (default: CPU count)
             
         Returns:
             pd.DataFrame: Summary DataFrame with columns:
                 [gene_name, accession_number, species, status, found_roi, roi_locus, gene]
         """
-        directory = Path(directory_path)
-        fasta_files = list(directory.glob("*.fasta")) + list(directory.glob("*.fa"))
+        # Collect FASTA files and JSON summary candidates in one directory pass
+        fasta_files = []
+        json_files = []
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_file():
+                        continue
+                    if entry.name.endswith(('.fasta', '.fa')):
+                        fasta_files.append(entry.path)
+                    elif entry.name.endswith('.json'):
+                        json_files.append(entry.path)
+        except OSError:
+            pass  # Missing or unreadable directory: reported below as having no FASTA files
         
         if not fasta_files:
             raise ValueError(f"No FASTA files found in directory: {directory_path}")
         
-        # Look for JSON summary file
-        json_files = list(directory.glob("*.json"))
-        json_file = json_files[0] if json_files else None
+        # Process files in name order, and use the first JSON summary file
+        fasta_files.sort()
+        json_file = min(json_files) if json_files else None
         
         results = []
         total_files = len(fasta_files)
-        
-        for idx, fasta_file in enumerate(fasta_files):
-            if progress_callback:
-                progress_callback(idx, total_files, f"Processing {fasta_file.name}")
+        # Index the JSON statuses once so workers never re-read the file
+        status_map = _build_status_map(json_file) if json_file else {}
+        
+        worker = functools.partial(_process_one_fasta, roi=roi, status_map=status_map)
+        max_workers = min(max_workers or os.cpu_count() or 1, total_files)
+        
+        if total_files < _PARALLEL_MIN_FILES or max_workers == 1:
+            # Small directory: scan in this process
+            for idx, fasta_file in enumerate(fasta_files):
+                results.extend(worker(fasta_file))
+                if progress_callback:
+                    progress_callback(idx + 1, total_files, f"Processed {os.path.basename(fasta_file)}")
+        else:
+            # Spawn (not fork) workers: the caller may be a thread of a Qt process
+            mp_context = multiprocessing.get_context("spawn")
             
+            # Workers log through a queue; a listener thread re-emits their records here
+            log_queue = mp_context.Queue()
+            log_listener = logging.handlers.QueueListener(log_queue, _WorkerLogHandler())
+            log_listener.start()
             try:
-                # Parse filename
-                accession, gene_name = SequenceProcessor.parse_filename(fasta_file.name)
-                
-                # Determine status from JSON if available
-                status = "Unknown"
-                if json_file:
-                    status = SequenceProcessor.determine_status_from_json(gene_name, str(json_file))
-                
-                # Read FASTA content
-                with open(fasta_file, 'r') as f:
-                    fasta_content = f.read()
-                
-                # Extract sequence
-                sequence = SequenceProcessor.extract_sequence_from_fasta(fasta_content)
-                
-                # Find all ROI occurrences
-                roi_occurrences = SequenceProcessor.find_all_roi_in_sequence(sequence, roi)
-                
-                if roi_occurrences:
-                    # Add one row for each ROI occurrence
-                    for roi_info in roi_occurrences:
-                        results.append({
-                            'gene_name': gene_name,
-                            'accession_number': accession,
-                            'species': 'homo sapiens',  # Default, could be extracted from FASTA header
-                            'status': status,
-                            'found_roi': True,
-                            'roi_locus': roi_info['roi_locus'],
-                            'gene': roi_info['roi_sequence']
-                        })
-                else:
-                    # No ROI found, add single row with NA values
-                    results.append({
-                        'gene_name': gene_name,
-                        'accession_number': accession,
-                        'species': 'homo sapiens',
-                        'status': status,
-                        'found_roi': False,
-                        'roi_locus': 'NA',
-                        'gene': 'NA'
-                    })
-                    
-            except Exception as e:
-                print(f"Error processing file {fasta_file.name}: {e}")
-                # Add error row
-                results.append({
-                    'gene_name': fasta_file.stem,
-                    'accession_number': 'ERROR',
-                    'species': 'NA',
-                    'status': 'ERROR',
-                    'found_roi': False,
-                    'roi_locus': 'NA',
-                    'gene': 'NA'
-                })
+                # Scan the files in parallel; map() yields rows in file order
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                         initializer=_init_worker_logging,
+                                         initargs=(log_queue, logger.getEffectiveLevel())) as executor:
+                    file_rows = executor.map(worker, fasta_files, chunksize=8)
+                    for idx, (fasta_file, rows) in enumerate(zip(fasta_files, file_rows)):
+                        results.extend(rows)
+                        if progress_callback:
+                            progress_callback(idx + 1, total_files, f"Processed {os.path.basename(fasta_file)}")
+            finally:
+                log_listener.stop()
         
         if progress_callback:
             progress_callback(total_files, total_files, "Processing complete!")
         
-        # Create DataFrame
-        df = pd.DataFrame(results)
-        
-        # Reorder columns to match specification
-        column_order = ['gene_name', 'accession_number', 'species', 'status', 'found_roi', 'roi_locus', 'gene']
-        df = df[column_order]
+        # Create DataFrame straight from the row tuples, in specification column order
+        df = pd.DataFrame(results, columns=_SUMMARY_COLUMNS)
         
         return df
     
@@ -303,6 +547,10 @@ class SequenceProcessor:
     def save_summary_to_excel(df: pd.DataFrame, output_path: str) -> str:
         """Save summary DataFrame to Excel file
         
+        Rows are streamed to disk, so memory use stays flat for large summaries.
+        For downstream analytics prefer save_summary_to_parquet, which is much
+        faster to write and read back.
+        
         Args:
             df (pd.DataFrame): Summary DataFrame
             output_path (str): Path to save Excel file
@@ -311,23 +559,41 @@ class SequenceProcessor:
             str: Full path to saved file
         """
         try:
-            df.to_excel(output_path, index=False)
-            return output_path
+            return write_excel_constant_memory(output_path, {'Sheet1': df})
         except Exception as e:
             raise Exception(f"Error saving Excel file: {e}")
     
     @staticmethod
-    def load_fasta_file(file_path):
+    def save_summary_to_parquet(df: pd.DataFrame, output_path: str) -> str:
+        """Save summary DataFrame to a zstd-compressed Parquet file
+        
+        Args:
+            df (pd.DataFrame): Summary DataFrame
+            output_path (str): Path to save Parquet file
+            
+        Returns:
+            str: Full path to saved file
+        """
+        try:
+            df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+            return output_path
+        except Exception as e:
+            raise Exception(f"Error saving Parquet file: {e}")
+    
+    @staticmethod
+    def load_fasta_file(file_path, as_bytes=False):
         """Load a FASTA file and return its content
         
         Args:
             file_path (str): Path to the FASTA file
+            as_bytes (bool): Return the raw bytes instead of decoded text, for
+                callers that only scan the sequence
             
         Returns:
-            str: Content of the FASTA file or None if error
+            str or bytes: Content of the FASTA file or None if error
         """
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb' if as_bytes else 'r') as f:
                 content = f.read()
             return content
         except Exception as e:
@@ -347,12 +613,15 @@ class SequenceProcessor:
             bool: True if successful, False otherwise
         """
         try:
-            with open(file_path, 'w') as f:
-                f.write(f">{header}\n")
+            with open(file_path, 'wb') as f:
+                f.write(f">{header}\n".encode())
                 
-                # Write sequence in chunks of 60 characters per line
-                for i in range(0, len(sequence), 60):
-                    f.write(sequence[i:i+60] + "\n")
+                # Write sequence in lines of 60 characters, wrapping and encoding
+                # about 1 MiB at a time so long sequences need few writes
+                for start in range(0, len(sequence), _FASTA_SLAB_SIZE):
+                    slab = sequence[start:start + _FASTA_SLAB_SIZE]
+                    lines = [slab[i:i+_FASTA_LINE_WIDTH] for i in range(0, len(slab), _FASTA_LINE_WIDTH)]
+                    f.write(("\n".join(lines) + "\n").encode())
             return True
         except Exception as e:
             print(f"Error saving FASTA file: {e}")
@@ -383,39 +652,128 @@ class SequenceProcessor:
         Returns:
             list: List of starting positions of the pattern
         """
-        positions = []
-        start = 0
+        return _find_all_positions(sequence, pattern)
+    
+    @staticmethod
+    def find_all_occurrences_multi(sequence, patterns):
+        """Find all occurrences of several patterns in a single pass over the sequence
         
-        while True:
-            pos = sequence.find(pattern, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
+        Args:
+            sequence (str or bytes): Sequence to search in; bytes are scanned without decoding
+            patterns (iterable): Patterns (str) to find
             
-        return positions
+        Returns:
+            dict: Mapping of each pattern to a list of its starting positions
+        """
+        # Drop empty and duplicate patterns, keeping the caller's order
+        patterns = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        occurrences = {pattern: [] for pattern in patterns}
+        
+        if not patterns:
+            return occurrences
+        
+        # Search raw bytes with encoded patterns
+        if isinstance(sequence, str):
+            needles = patterns
+        else:
+            # Non-ASCII patterns cannot occur in the bytes and keep no positions
+            patterns = [pattern for pattern in patterns if _encode_roi(pattern) is not None]
+            needles = [_encode_roi(pattern) for pattern in patterns]
+            if not patterns:
+                return occurrences
+        
+        if len(patterns) == 1:
+            occurrences[patterns[0]] = _find_all_positions(sequence, needles[0])
+            return occurrences
+        
+        # The scanner stops at every position where at least one pattern starts;
+        # several patterns can start at the same position, so check each of them there
+        for match in _multi_pattern_scanner(tuple(needles)).finditer(sequence):
+            pos = match.start()
+            for pattern, needle in zip(patterns, needles):
+                if sequence.startswith(needle, pos):
+                    occurrences[pattern].append(pos)
+                    
+        return occurrences
     
     @staticmethod
     def reverse_complement(dna_sequence):
         """Get the reverse complement of a DNA sequence
         
         Args:
-            dna_sequence (str): DNA sequence
+            dna_sequence (str or bytes): DNA sequence
+            
+        Returns:
+            str or bytes: Reverse complement of the DNA sequence (same type as input)
+        """
+        # Complement in a single C-level pass, then reverse
+        if isinstance(dna_sequence, (bytes, bytearray)):
+            return dna_sequence.translate(_COMPLEMENT_TABLE_BYTES)[::-1]
+        return dna_sequence.translate(_COMPLEMENT_TABLE)[::-1]
+    
+    @staticmethod
+    def pack_2bit(dna_sequence):
+        """Pack a DNA sequence into 2 bits per base (A=0, C=1, G=2, T=3)
+        
+        The packed form holds 4 bases per byte, for pipelines that make several
+        passes over a long sequence. The last byte is padded with A.
+        
+        Args:
+            dna_sequence (str or bytes): DNA sequence containing only A, C, G, T (any case)
             
         Returns:
-            str: Reverse complement of the DNA sequence
+            Tuple[np.ndarray, int]: (packed uint8 array, number of bases)
         """
-        complement = {'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A', 
-                      'a': 't', 'c': 'g', 'g': 'c', 't': 'a',
-                      'N': 'N', 'n': 'n'}
+        if isinstance(dna_sequence, str):
+            dna_sequence = dna_sequence.encode('ascii', 'replace')
+        codes = np.frombuffer(dna_sequence.translate(_BASE_TO_2BIT), dtype=np.uint8)
         
-        # Create the complement
-        complement_seq = ''.join(complement.get(base, base) for base in dna_sequence)
+        if (codes & _UNKNOWN_BASE).any():
+            raise ValueError("Only A, C, G and T can be packed into 2 bits per base")
         
-        # Reverse the complement
-        reverse_complement_seq = complement_seq[::-1]
+        length = len(codes)
+        codes = np.concatenate([codes, np.zeros(-length % 4, dtype=np.uint8)]).reshape(-1, 4)
+        packed = (codes[:, 0] << 6) | (codes[:, 1] << 4) | (codes[:, 2] << 2) | codes[:, 3]
+        return packed, length
+    
+    @staticmethod
+    def unpack_2bit(packed, length):
+        """Unpack a 2-bit packed DNA sequence
         
-        return reverse_complement_seq
+        Args:
+            packed (np.ndarray): Packed uint8 array from pack_2bit
+            length (int): Number of bases
+            
+        Returns:
+            bytes: Upper-case DNA sequence
+        """
+        codes = (packed[:, None] >> np.array([6, 4, 2, 0], dtype=np.uint8)) & 3
+        return _2BIT_TO_BASE[codes.ravel()[:length]].tobytes()
+    
+    @staticmethod
+    def reverse_complement_packed(packed, length):
+        """Get the reverse complement of a 2-bit packed DNA sequence
+        
+        With A=0, C=1, G=2, T=3 the complement of every base is its code XOR 3,
+        so a whole byte is complemented with XOR 0xFF; reversing flips the byte
+        order and the base order within each byte.
+        
+        Args:
+            packed (np.ndarray): Packed uint8 array from pack_2bit
+            length (int): Number of bases
+            
+        Returns:
+            np.ndarray: Packed reverse complement (same length, padded with A)
+        """
+        result = _REVERSE_2BIT_LUT[packed[::-1] ^ 0xFF]
+        
+        # The padding of the last byte is now at the front; shift it out
+        shift = 2 * (-length % 4)
+        if shift:
+            shifted = result << shift
+            shifted[:-1] |= result[1:] >> (8 - shift)
+            result = shifted
+        return result
     
     @staticmethod
     def translate_dna(dna_sequence):
@@ -427,44 +785,102 @@ class SequenceProcessor:
         Returns:
             str: Protein sequence
         """
-        # Genetic code
-        genetic_code = {
-            'ATA': 'I', 'ATC': 'I', 'ATT': 'I', 'ATG': 'M',
-            'ACA': 'T', 'ACC': 'T', 'ACG': 'T', 'ACT': 'T',
-            'AAC': 'N', 'AAT': 'N', 'AAA': 'K', 'AAG': 'K',
-            'AGC': 'S', 'AGT': 'S', 'AGA': 'R', 'AGG': 'R',
-            'CTA': 'L', 'CTC': 'L', 'CTG': 'L', 'CTT': 'L',
-            'CCA': 'P', 'CCC': 'P', 'CCG': 'P', 'CCT': 'P',
-            'CAC': 'H', 'CAT': 'H', 'CAA': 'Q', 'CAG': 'Q',
-            'CGA': 'R', 'CGC': 'R', 'CGG': 'R', 'CGT': 'R',
-            'GTA': 'V', 'GTC': 'V', 'GTG': 'V', 'GTT': 'V',
-            'GCA': 'A', 'GCC': 'A', 'GCG': 'A', 'GCT': 'A',
-            'GAC': 'D', 'GAT': 'D', 'GAA': 'E', 'GAG': 'E',
-            'GGA': 'G', 'GGC': 'G', 'GGG': 'G', 'GGT': 'G',
-            'TCA': 'S', 'TCC': 'S', 'TCG': 'S', 'TCT': 'S',
-            'TTC': 'F', 'TTT': 'F', 'TTA': 'L', 'TTG': 'L',
-            'TAC': 'Y', 'TAT': 'Y', 'TAA': '*', 'TAG': '*',
-            'TGC': 'C', 'TGT': 'C', 'TGA': '*', 'TGG': 'W',
-        }
-        
-        # Make sequence uppercase
-        dna_sequence = dna_sequence.upper()
-        
-        # Translate
-        protein = ""
-        for i in range(0, len(dna_sequence), 3):
-            codon = dna_sequence[i:i+3]
+        # Map each base to its 2-bit code; anything else gets the 0b100 flag
+        codes = dna_sequence.encode('ascii', 'replace').translate(_BASE_TO_2BIT)
+        
+        # Translate into a preallocated buffer, skipping an incomplete trailing codon
+        protein = bytearray(len(codes) // 3)
+        length = 0
+        for i in range(0, len(codes) - 2, 3):
+            b0, b1, b2 = codes[i], codes[i + 1], codes[i + 2]
             
-            # Skip if the codon is incomplete
-            if len(codon) < 3:
-                continue
-                
-            # Translate the codon
-            amino_acid = genetic_code.get(codon, 'X')  # 'X' for unknown codons
-            protein += amino_acid
+            if (b0 | b1 | b2) & _UNKNOWN_BASE:
+                amino_acid = _UNKNOWN_AMINO_ACID  # 'X' for unknown codons
+            else:
+                amino_acid = _CODON_TABLE[(b0 << 4) | (b1 << 2) | b2]
+            protein[length] = amino_acid
+            length += 1
             
             # Stop at the first stop codon
-            if amino_acid == '*':
+            if amino_acid == _STOP_CODON:
                 break
                 
-        return protein
\ No newline at end of file
+        return protein[:length].decode('ascii')
+
+
+class _WorkerLogHandler(logging.Handler):
+    """Re-emit log records received from worker processes through this process's loggers"""
+    
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(log_queue, level: int):
+    """Send all log records of a worker process to the parent's log queue
+    
+    Args:
+        log_queue (multiprocessing.Queue): Queue drained by the parent's QueueListener
+        level (int): Effective log level of the parent's module logger
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _process_one_fasta(fasta_file: str, roi: str, status_map: Dict[str, str]) -> List[Tuple]:
+    """Build the summary rows for a single FASTA file
+    
+    Runs in a worker process of SequenceProcessor.process_fasta_directory,
+    so it has to be a picklable module-level function.
+    
+    Args:
+        fasta_file (str): Path of the FASTA file to scan
+        roi (str): Region of Interest sequence to find
+        status_map (Dict[str, str]): Upper-cased gene name -> status, from _build_status_map
+        
+    Returns:
+        List[Tuple]: One row per ROI occurrence, or a single NA/ERROR row,
+            with fields in _SUMMARY_COLUMNS order
+    """
+    file_name = os.path.basename(fasta_file)
+    try:
+        # Parse filename
+        accession, gene_name = SequenceProcessor.parse_filename(file_name)
+        
+        # Look up status from the JSON index
+        status = status_map.get(gene_name.upper(), "Unknown")
+        
+        # Map the FASTA file and extract the sequence as bytes, without decoding
+        with open(fasta_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as fasta_content:
+                    sequence = SequenceProcessor.extract_sequence_from_fasta(fasta_content)
+            else:
+                sequence = b''  # Empty files can't be mapped
+        
+        # Find all ROI hit positions; rows are built straight from them
+        roi_bytes = _encode_roi(roi)
+        roi_positions = _make_scanner(roi_bytes)(sequence) if roi_bytes is not None else []
+        
+        if not roi_positions:
+            # No ROI found, add single row with NA values
+            return [(gene_name, accession, 'homo sapiens', status, False, 'NA', 'NA')]
+        
+        # Add one row for each ROI occurrence, with the same context window and
+        # locus as find_all_roi_in_sequence
+        # (species defaults to homo sapiens, could be extracted from FASTA header)
+        rows = []
+        seq_len = len(sequence)
+        roi_end_offset = len(roi) + _ROI_CONTEXT_SIZE
+        for roi_index in roi_positions:
+            context_start = max(0, roi_index - _ROI_CONTEXT_SIZE)
+            context_end = min(seq_len, roi_index + roi_end_offset)
+            rows.append((gene_name, accession, 'homo sapiens', status, True,
+                         f"{context_start}_{context_end-1}",
+                         sequence[context_start:context_end].decode('ascii', 'replace')))
+        return rows
+        
+    except Exception:
+        logger.exception("Error processing file %s", file_name)
+        # Add error row
+        return [(os.path.splitext(file_name)[0], 'ERROR', 'NA', 'ERROR', False, 'NA', 'NA')]
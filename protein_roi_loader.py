@@ -4,9 +4,207 @@ Handles loading and validation of protein sequences and ROI data from Excel file
 """
 
 import pandas as pd
+import numpy as np
 import os
-import re
+import hashlib
+import functools
+from collections import Counter
+from datetime import datetime
 from typing import List, Dict, Tuple, Optional
+from _seq_kernels import batch_composition
+from excel_export import write_excel_constant_memory
+
+# Valid amino acid / nucleotide letters
+_AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+_NUCLEOTIDES = 'ATCG'
+_VALID_AA = frozenset(_AMINO_ACIDS)
+_VALID_NT = frozenset(_NUCLEOTIDES)
+
+# Bytes removed when cleaning upper-cased sequences: everything that is not
+# a valid letter (whitespace included)
+_NON_PROTEIN_BYTES = bytes(b for b in range(256) if chr(b) not in _VALID_AA)
+_NON_DNA_BYTES = bytes(b for b in range(256) if chr(b) not in _VALID_NT)
+
+# Byte values of the valid letters, for indexing _byte_counts() results
+_AA_ORDS = np.frombuffer(_AMINO_ACIDS.encode('ascii'), dtype=np.uint8)
+_NT_ORDS = np.frombuffer(_NUCLEOTIDES.encode('ascii'), dtype=np.uint8)
+
+# Ranking of job complexity estimates (unknown values count as 'High')
+_COMPLEXITY_ORDER = {'Low': 1, 'Medium': 2, 'High': 3}
+
+
+@functools.lru_cache(maxsize=4096)
+def _complexity_for(protein_length: int, roi_length: int) -> str:
+    """Estimate job complexity from the protein and ROI lengths (memoized)
+    
+    Args:
+        protein_length (int): Protein length in amino acids
+        roi_length (int): ROI length in base pairs
+        
+    Returns:
+        str: Complexity estimate ('Low', 'Medium', 'High')
+    """
+    total_residues = protein_length + (roi_length // 3)  # Approximate amino acids from DNA
+    
+    if total_residues < 200:
+        return 'Low'
+    elif total_residues < 500:
+        return 'Medium'
+    else:
+        return 'High'
+
+
+# Cell strings pandas' read_excel treats as missing by default; the streaming
+# reader maps them to None so both code paths skip the same rows
+_EXCEL_NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
+
+# Workbook formats the openpyxl streaming reader can open
+_STREAMABLE_EXCEL_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def _stream_protein_xlsx(file_path: str, name_column: int, sequence_column: int,
+                         sheet_name: str = None):
+    """Stream (row_index, name, sequence) tuples from an .xlsx sheet
+    
+    Uses openpyxl's read_only mode, so cells are parsed row by row and never
+    materialized as a DataFrame. The first row is treated as the header, and
+    row indexes match the DataFrame index read_excel would have produced.
+    
+    Args:
+        file_path (str): Path to Excel file
+        name_column (int): Column index for protein names
+        sequence_column (int): Column index for protein sequences
+        sheet_name (str, optional): Sheet name to read (first sheet if omitted)
+        
+    Yields:
+        Tuple: (row_index, name, sequence) for rows with both cells filled
+    """
+    import openpyxl
+    
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        next(rows, None)  # Skip the header row
+        
+        for index, row in enumerate(rows):
+            name_value = row[name_column] if name_column < len(row) else None
+            sequence_value = row[sequence_column] if sequence_column < len(row) else None
+            
+            if isinstance(name_value, str) and name_value in _EXCEL_NA_STRINGS:
+                name_value = None
+            if isinstance(sequence_value, str) and sequence_value in _EXCEL_NA_STRINGS:
+                sequence_value = None
+            
+            # Skip rows missing a name or a sequence
+            if name_value is None or sequence_value is None:
+                continue
+            
+            yield index, name_value, sequence_value
+    finally:
+        workbook.close()
+
+
+def _byte_counts(sequence: str) -> np.ndarray:
+    """Count every byte value of a sequence in a single pass
+    
+    ASCII letters are counted exactly; non-ASCII characters only show up as
+    counts of their UTF-8 bytes (>= 0x80).
+    
+    Args:
+        sequence (str): Sequence to count
+        
+    Returns:
+        np.ndarray: 256 counts indexed by byte value
+    """
+    return np.bincount(np.frombuffer(sequence.encode('utf-8'), dtype=np.uint8), minlength=256)
+
+
+# Validation results are cached by sequence content (bounded, oldest evicted
+# first). Short sequences are their own key; longer ones are keyed by digest.
+_VALIDATION_CACHE_SIZE = 4096
+_RAW_KEY_MAX_LENGTH = 2048
+_protein_validation_cache: Dict = {}
+_dna_validation_cache: Dict = {}
+
+
+def _validation_key(sequence: str):
+    """Return the validation cache key of a sequence
+    
+    Args:
+        sequence (str): Sequence being validated
+        
+    Returns:
+        The sequence itself if short, otherwise its 16-byte blake2b digest
+    """
+    if len(sequence) < _RAW_KEY_MAX_LENGTH:
+        return sequence
+    return hashlib.blake2b(sequence.encode('utf-8'), digest_size=16).digest()
+
+
+def _copy_validation(validation: Dict) -> Dict:
+    """Copy a cached validation result so callers can modify it freely
+    
+    Args:
+        validation (Dict): Cached validation information
+        
+    Returns:
+        Dict: Copy with its own warnings list and composition entries
+    """
+    copied = dict(validation)
+    copied['warnings'] = list(validation['warnings'])
+    for key in ('amino_acid_composition', 'nucleotide_composition'):
+        if key in copied:
+            copied[key] = {letter: dict(stats) for letter, stats in validation[key].items()}
+    return copied
+
+
+def _cache_validation(cache: Dict, key, validation: Dict):
+    """Store a validation result, evicting the oldest entry when the cache is full
+    
+    Args:
+        cache (Dict): Validation cache to update
+        key: Cache key from _validation_key()
+        validation (Dict): Validation information
+    """
+    if len(cache) >= _VALIDATION_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = validation
+
+
+def _cached_validations(sequences: List[str], cache: Dict, validate_batch) -> List[Dict]:
+    """Validate many sequences, computing only those not already cached
+    
+    Args:
+        sequences (List[str]): Non-empty sequences to validate
+        cache (Dict): Validation cache for this kind of sequence
+        validate_batch: Callable validating a list of sequences in one go
+        
+    Returns:
+        List[Dict]: Validation information for each sequence, in order
+    """
+    keys = [_validation_key(sequence) for sequence in sequences]
+    
+    # Look up each distinct sequence once; the misses are validated together
+    results = {}
+    pending = {}
+    for key, sequence in zip(keys, sequences):
+        if key in results or key in pending:
+            continue
+        if key in cache:
+            results[key] = cache[key]
+        else:
+            pending[key] = sequence
+    
+    if pending:
+        for key, validation in zip(pending, validate_batch(list(pending.values()))):
+            results[key] = validation
+            _cache_validation(cache, key, validation)
+    
+    return [_copy_validation(results[key]) for key in keys]
 
 
 class ProteinDataLoader:
@@ -30,21 +228,31 @@ class ProteinDataLoader:
             Exception: If file cannot be read or data is invalid
         """
         try:
-            # Read Excel file
-            if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+            if os.path.splitext(file_path)[1].lower() in _STREAMABLE_EXCEL_EXTENSIONS:
+                # Stream the two columns straight from the workbook
+                rows = _stream_protein_xlsx(file_path, name_column, sequence_column, sheet_name)
             else:
-                df = pd.read_excel(file_path)
-            
-            # Remove empty rows
-            df = df.dropna(how='all')
+                # Read only the name and sequence columns; usecols keeps them in file order
+                usecols = sorted({name_column, sequence_column})
+                if sheet_name:
+                    df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=usecols)
+                else:
+                    df = pd.read_excel(file_path, usecols=usecols)
+                name_column = usecols.index(name_column)
+                sequence_column = usecols.index(sequence_column)
+                
+                # Keep only rows with both a name and a sequence, in one vectorized check
+                df = df[df.iloc[:, [name_column, sequence_column]].notna().all(axis=1).to_numpy()]
+                
+                # Walk the two columns as plain arrays instead of building a Series per row
+                rows = zip(df.index, df.iloc[:, name_column].to_numpy(), df.iloc[:, sequence_column].to_numpy())
             
             proteins = []
-            for index, row in df.iterrows():
+            for index, name_value, sequence_value in rows:
                 try:
                     # Extract protein name and sequence
-                    protein_name = str(row.iloc[name_column]).strip() if pd.notna(row.iloc[name_column]) else None
-                    protein_seq = str(row.iloc[sequence_column]).strip() if pd.notna(row.iloc[sequence_column]) else None
+                    protein_name = str(name_value).strip()
+                    protein_seq = str(sequence_value).strip()
                     
                     # Skip invalid entries
                     if not protein_name or not protein_seq or protein_name.lower() in ['nan', 'none', '']:
@@ -62,16 +270,18 @@ class ProteinDataLoader:
                             'row_index': index
                         }
                         
-                        # Add validation info
-                        validation = ProteinDataLoader.validate_protein_sequence(cleaned_seq)
-                        protein_data.update(validation)
-                        
                         proteins.append(protein_data)
                         
                 except Exception as e:
                     print(f"Error processing row {index}: {e}")
                     continue
             
+            # Add validation info, reusing cached results for repeated sequences
+            validations = _cached_validations([protein['sequence'] for protein in proteins],
+                                              _protein_validation_cache, ProteinDataLoader._validate_batch)
+            for protein_data, validation in zip(proteins, validations):
+                protein_data.update(validation)
+            
             return proteins
             
         except Exception as e:
@@ -90,14 +300,9 @@ class ProteinDataLoader:
         if not sequence:
             return ""
         
-        # Remove whitespace and convert to uppercase
-        cleaned = re.sub(r'\s+', '', sequence.upper())
-        
-        # Keep only valid amino acid letters
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWY')
-        cleaned = ''.join(char for char in cleaned if char in valid_aa)
-        
-        return cleaned
+        # Convert to uppercase and keep only valid amino acid letters in one C-level
+        # pass (whitespace and non-ASCII characters are dropped along the way)
+        return sequence.upper().encode('ascii', 'ignore').translate(None, _NON_PROTEIN_BYTES).decode('ascii')
     
     @staticmethod
     def validate_protein_sequence(sequence: str) -> Dict:
@@ -106,6 +311,50 @@ class ProteinDataLoader:
         Args:
             sequence (str): Protein sequence to validate
             
+        Returns:
+            Dict: Validation information
+        """
+        if not sequence:
+            return {
+                'is_valid': False,
+                'warnings': ["Empty sequence"],
+                'amino_acid_composition': {}
+            }
+        
+        key = _validation_key(sequence)
+        validation = _protein_validation_cache.get(key)
+        if validation is None:
+            # Count all characters in one pass
+            counts = _byte_counts(sequence)
+            validation = ProteinDataLoader._validation_from_counts(
+                sequence, counts[_AA_ORDS].tolist(), int(counts[ord('X')]))
+            _cache_validation(_protein_validation_cache, key, validation)
+        
+        return _copy_validation(validation)
+    
+    @staticmethod
+    def _validate_batch(sequences: List[str]) -> List[Dict]:
+        """Validate non-empty protein sequences, counting all their compositions at once
+        
+        Args:
+            sequences (List[str]): Protein sequences to validate
+            
+        Returns:
+            List[Dict]: Validation information for each sequence
+        """
+        counts = batch_composition(sequences, _AMINO_ACIDS + 'X')
+        return [ProteinDataLoader._validation_from_counts(sequence, row_counts[:-1], row_counts[-1])
+                for sequence, row_counts in zip(sequences, counts.tolist())]
+    
+    @staticmethod
+    def _validation_from_counts(sequence: str, aa_counts: List[int], x_count: int) -> Dict:
+        """Build the validation info of a non-empty protein sequence from its letter counts
+        
+        Args:
+            sequence (str): Protein sequence being validated
+            aa_counts (List[int]): Count of each letter of _AMINO_ACIDS, in order
+            x_count (int): Count of 'X'
+            
         Returns:
             Dict: Validation information
         """
@@ -115,11 +364,6 @@ class ProteinDataLoader:
             'amino_acid_composition': {}
         }
         
-        if not sequence:
-            validation['is_valid'] = False
-            validation['warnings'].append("Empty sequence")
-            return validation
-        
         # Check length
         if len(sequence) < 10:
             validation['warnings'].append(f"Very short sequence ({len(sequence)} AA)")
@@ -127,14 +371,12 @@ class ProteinDataLoader:
             validation['warnings'].append(f"Very long sequence ({len(sequence)} AA)")
         
         # Check for invalid characters
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWY')
-        invalid_chars = set(sequence) - valid_aa
-        if invalid_chars:
+        if sum(aa_counts) != len(sequence):
+            invalid_chars = set(sequence) - _VALID_AA
             validation['warnings'].append(f"Invalid characters found: {invalid_chars}")
         
         # Calculate amino acid composition
-        for aa in valid_aa:
-            count = sequence.count(aa)
+        for aa, count in zip(_AMINO_ACIDS, aa_counts):
             if count > 0:
                 validation['amino_acid_composition'][aa] = {
                     'count': count,
@@ -142,7 +384,7 @@ class ProteinDataLoader:
                 }
         
         # Check for unusual composition
-        if sequence.count('X') > len(sequence) * 0.1:
+        if x_count > len(sequence) * 0.1:
             validation['warnings'].append("High percentage of unknown amino acids (X)")
         
         return validation
@@ -166,32 +408,55 @@ class ROIDataLoader:
             Exception: If file cannot be read or required columns are missing
         """
         try:
-            # Read Excel file
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            # Read Excel file, skipping columns that are never used
+            required_columns = ['gene_name', 'gene', 'roi_locus', 'found_roi']
+            wanted_columns = set(required_columns) | {'accession_number', 'species', 'status'}
+            df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=lambda column: column in wanted_columns)
             
             # Check required columns
-            required_columns = ['gene_name', 'gene', 'roi_locus', 'found_roi']
             missing_columns = [col for col in required_columns if col not in df.columns]
             
             if missing_columns:
                 raise Exception(f"Missing required columns: {missing_columns}")
             
-            # Filter for rows where ROI was found
-            roi_df = df[df['found_roi'] == True].copy()
+            # Filter for rows where ROI was found; the result is only read, so no
+            # defensive copy is needed
+            roi_df = df[df['found_roi'].eq(True).to_numpy()]
             
             if roi_df.empty:
                 raise Exception("No ROI sequences found in the data")
             
+            # Walk the columns as plain arrays instead of building a Series per row
+            def column_values(column):
+                return roi_df[column].to_numpy()
+            
+            # Optional text columns are filled and cast to str in one vectorized
+            # step; missing columns fall back to their defaults
+            def text_values(column, default):
+                if column in roi_df.columns:
+                    return roi_df[column].fillna(default).astype(str).to_numpy()
+                return [default] * len(roi_df)
+            
+            columns = zip(
+                roi_df.index,
+                column_values('gene_name'),
+                column_values('gene'),
+                column_values('roi_locus'),
+                text_values('accession_number', 'Unknown'),
+                text_values('species', 'homo sapiens'),
+                text_values('status', 'Unknown')
+            )
+            
             roi_data = []
-            for index, row in roi_df.iterrows():
+            for index, gene_value, sequence_value, locus_value, accession, species, status in columns:
                 try:
                     # Extract ROI information
-                    gene_name = str(row['gene_name']).strip()
-                    roi_sequence = str(row['gene']).strip()
-                    roi_locus = str(row['roi_locus']).strip()
+                    gene_name = str(gene_value).strip()
+                    roi_sequence = str(sequence_value).strip()
+                    roi_locus = str(locus_value).strip()
                     
                     # Skip invalid entries
-                    if pd.isna(row['gene']) or pd.isna(row['gene_name']) or pd.isna(row['roi_locus']):
+                    if pd.isna(sequence_value) or pd.isna(gene_value) or pd.isna(locus_value):
                         continue
                     
                     # Clean and validate DNA sequence
@@ -202,24 +467,26 @@ class ROIDataLoader:
                             'gene_name': gene_name,
                             'roi_sequence': cleaned_seq,
                             'roi_locus': roi_locus,
-                            'accession': str(row.get('accession_number', 'Unknown')),
-                            'species': str(row.get('species', 'homo sapiens')),
-                            'status': str(row.get('status', 'Unknown')),
+                            'accession': accession,
+                            'species': species,
+                            'status': status,
                             'original_length': len(roi_sequence),
                             'cleaned_length': len(cleaned_seq),
                             'row_index': index
                         }
                         
-                        # Add validation info
-                        validation = ROIDataLoader.validate_dna_sequence(cleaned_seq)
-                        roi_entry.update(validation)
-                        
                         roi_data.append(roi_entry)
                         
                 except Exception as e:
                     print(f"Error processing ROI row {index}: {e}")
                     continue
             
+            # Add validation info, reusing cached results for repeated sequences
+            validations = _cached_validations([roi['roi_sequence'] for roi in roi_data],
+                                              _dna_validation_cache, ROIDataLoader._validate_batch)
+            for roi_entry, validation in zip(roi_data, validations):
+                roi_entry.update(validation)
+            
             return roi_data
             
         except Exception as e:
@@ -238,14 +505,9 @@ class ROIDataLoader:
         if not sequence:
             return ""
         
-        # Remove whitespace and convert to uppercase
-        cleaned = re.sub(r'\s+', '', sequence.upper())
-        
-        # Keep only valid DNA nucleotides
-        valid_nucleotides = set('ATCG')
-        cleaned = ''.join(char for char in cleaned if char in valid_nucleotides)
-        
-        return cleaned
+        # Convert to uppercase and keep only valid DNA nucleotides in one C-level
+        # pass (whitespace and non-ASCII characters are dropped along the way)
+        return sequence.upper().encode('ascii', 'ignore').translate(None, _NON_DNA_BYTES).decode('ascii')
     
     @staticmethod
     def validate_dna_sequence(sequence: str) -> Dict:
@@ -254,6 +516,47 @@ class ROIDataLoader:
         Args:
             sequence (str): DNA sequence to validate
             
+        Returns:
+            Dict: Validation information
+        """
+        if not sequence:
+            return {
+                'is_valid': False,
+                'warnings': ["Empty sequence"],
+                'nucleotide_composition': {}
+            }
+        
+        key = _validation_key(sequence)
+        validation = _dna_validation_cache.get(key)
+        if validation is None:
+            # Count all characters in one pass
+            validation = ROIDataLoader._validation_from_counts(sequence, _byte_counts(sequence)[_NT_ORDS].tolist())
+            _cache_validation(_dna_validation_cache, key, validation)
+        
+        return _copy_validation(validation)
+    
+    @staticmethod
+    def _validate_batch(sequences: List[str]) -> List[Dict]:
+        """Validate non-empty DNA sequences, counting all their compositions at once
+        
+        Args:
+            sequences (List[str]): DNA sequences to validate
+            
+        Returns:
+            List[Dict]: Validation information for each sequence
+        """
+        counts = batch_composition(sequences, _NUCLEOTIDES)
+        return [ROIDataLoader._validation_from_counts(sequence, row_counts)
+                for sequence, row_counts in zip(sequences, counts.tolist())]
+    
+    @staticmethod
+    def _validation_from_counts(sequence: str, nt_counts: List[int]) -> Dict:
+        """Build the validation info of a non-empty DNA sequence from its nucleotide counts
+        
+        Args:
+            sequence (str): DNA sequence being validated
+            nt_counts (List[int]): Count of each letter of _NUCLEOTIDES, in order
+            
         Returns:
             Dict: Validation information
         """
@@ -263,11 +566,6 @@ class ROIDataLoader:
             'nucleotide_composition': {}
         }
         
-        if not sequence:
-            validation['is_valid'] = False
-            validation['warnings'].append("Empty sequence")
-            return validation
-        
         # Check length
         if len(sequence) < 10:
             validation['warnings'].append(f"Very short sequence ({len(sequence)} bp)")
@@ -275,23 +573,23 @@ class ROIDataLoader:
             validation['warnings'].append(f"Very long sequence ({len(sequence)} bp)")
         
         # Check for invalid characters
-        valid_nucleotides = set('ATCG')
-        invalid_chars = set(sequence) - valid_nucleotides
-        if invalid_chars:
+        if sum(nt_counts) != len(sequence):
+            invalid_chars = set(sequence) - _VALID_NT
             validation['warnings'].append(f"Invalid characters found: {invalid_chars}")
         
         # Calculate nucleotide composition
-        for nucleotide in valid_nucleotides:
-            count = sequence.count(nucleotide)
+        composition = dict(zip(_NUCLEOTIDES, nt_counts))
+        for nucleotide, count in composition.items():
             if count > 0:
                 validation['nucleotide_composition'][nucleotide] = {
                     'count': count,
                     'percentage': round((count / len(sequence)) * 100, 2)
                 }
         
-        # Check GC content
-        gc_count = sequence.count('G') + sequence.count('C')
-        gc_content = (gc_count / len(sequence)) * 100 if len(sequence) > 0 else 0
+        # Check GC content over the valid nucleotides, reusing the counts above
+        gc_count = composition['G'] + composition['C']
+        at_count = composition['A'] + composition['T']
+        gc_content = (gc_count / (gc_count + at_count)) * 100 if gc_count + at_count > 0 else 0
         validation['gc_content'] = round(gc_content, 2)
         
         if gc_content < 20 or gc_content > 80:
@@ -304,21 +602,49 @@ class JobPairGenerator:
     """Class for generating protein-ROI job pairs"""
     
     @staticmethod
-    def create_all_combinations(proteins: List[Dict], roi_data: List[Dict]) -> List[Dict]:
+    def create_all_combinations(proteins: List[Dict], roi_data: List[Dict], *,
+                                max_protein_length: int = None, max_roi_length: int = None,
+                                complexity_limit: str = None) -> List[Dict]:
         """Create all possible protein-ROI combinations for AlphaFold jobs
         
+        The optional criteria match filter_jobs_by_criteria, but are applied
+        before a pair is built, so rejected jobs are never created.
+        
         Args:
             proteins (List[Dict]): List of protein data
             roi_data (List[Dict]): List of ROI data
+            max_protein_length (int, optional): Maximum protein length
+            max_roi_length (int, optional): Maximum ROI length
+            complexity_limit (str, optional): Maximum complexity level
             
         Returns:
             List[Dict]: List of job dictionaries
         """
+        # One timestamp for the whole batch
+        now = datetime.now()
+        timestamp = now.strftime("%Y_%m_%d_%H_%M")
+        created_time = now.isoformat()
+        
+        # Length checks only depend on one side of a pair, so apply them once per item
+        if max_protein_length:
+            proteins = [protein for protein in proteins if protein['length'] <= max_protein_length]
+        if max_roi_length:
+            roi_data = [roi for roi in roi_data if len(roi['roi_sequence']) <= max_roi_length]
+        
+        max_complexity_level = _COMPLEXITY_ORDER.get(complexity_limit, 3)
+        roi_lengths = [len(roi['roi_sequence']) for roi in roi_data]
+        
         jobs = []
         
         for protein in proteins:
-            for roi in roi_data:
-                job = JobPairGenerator.create_job_pair(protein, roi)
+            protein_length = protein['length']
+            for roi, roi_length in zip(roi_data, roi_lengths):
+                # Check complexity
+                complexity = _complexity_for(protein_length, roi_length)
+                if _COMPLEXITY_ORDER.get(complexity, 3) > max_complexity_level:
+                    continue
+                
+                job = JobPairGenerator._create_job_pair(protein, roi, timestamp, created_time, complexity)
                 jobs.append(job)
         
         return jobs
@@ -334,13 +660,30 @@ class JobPairGenerator:
         Returns:
             Dict: Job dictionary
         """
-        from datetime import datetime
-        
-        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M")
+        now = datetime.now()
+        return JobPairGenerator._create_job_pair(protein, roi, now.strftime("%Y_%m_%d_%H_%M"), now.isoformat())
+    
+    @staticmethod
+    def _create_job_pair(protein: Dict, roi: Dict, timestamp: str, created_time: str,
+                         complexity: str = None) -> Dict:
+        """Create a single protein-ROI job pair with a given timestamp
         
+        Args:
+            protein (Dict): Protein data
+            roi (Dict): ROI data
+            timestamp (str): Job name timestamp ("%Y_%m_%d_%H_%M")
+            created_time (str): ISO creation time
+            complexity (str, optional): Complexity estimate if already computed
+            
+        Returns:
+            Dict: Job dictionary
+        """
         # Generate job name according to specification
         job_name = f"Protein-DNA_{protein['name']}_{roi['gene_name']}_{roi['roi_locus']}_{timestamp}"
         
+        if complexity is None:
+            complexity = JobPairGenerator.estimate_job_complexity(protein, roi)
+        
         return {
             'job_name': job_name,
             'protein_name': protein['name'],
@@ -351,8 +694,8 @@ class JobPairGenerator:
             'roi_locus': roi['roi_locus'],
             'accession': roi['accession'],
             'species': roi['species'],
-            'created_time': datetime.now().isoformat(),
-            'estimated_complexity': JobPairGenerator.estimate_job_complexity(protein, roi)
+            'created_time': created_time,
+            'estimated_complexity': complexity
         }
     
     @staticmethod
@@ -366,17 +709,7 @@ class JobPairGenerator:
         Returns:
             str: Complexity estimate ('Low', 'Medium', 'High')
         """
-        protein_length = protein['length']
-        roi_length = len(roi['roi_sequence'])
-        
-        total_residues = protein_length + (roi_length // 3)  # Approximate amino acids from DNA
-        
-        if total_residues < 200:
-            return 'Low'
-        elif total_residues < 500:
-            return 'Medium'
-        else:
-            return 'High'
+        return _complexity_for(protein['length'], len(roi['roi_sequence']))
     
     @staticmethod
     def filter_jobs_by_criteria(jobs: List[Dict], max_protein_length: int = None, 
@@ -394,8 +727,7 @@ class JobPairGenerator:
         """
         filtered_jobs = []
         
-        complexity_order = {'Low': 1, 'Medium': 2, 'High': 3}
-        max_complexity_level = complexity_order.get(complexity_limit, 3)
+        max_complexity_level = _COMPLEXITY_ORDER.get(complexity_limit, 3)
         
         for job in jobs:
             # Check protein length
@@ -407,7 +739,7 @@ class JobPairGenerator:
                 continue
             
             # Check complexity
-            job_complexity_level = complexity_order.get(job['estimated_complexity'], 3)
+            job_complexity_level = _COMPLEXITY_ORDER.get(job['estimated_complexity'], 3)
             if job_complexity_level > max_complexity_level:
                 continue
             
@@ -430,6 +762,7 @@ class DataValidator:
             Tuple[List[Dict], List[str]]: (valid_proteins, validation_warnings)
         """
         valid_proteins = []
+        valid_names = set()  # names of every protein in valid_proteins
         warnings = []
         
         for i, protein in enumerate(proteins):
@@ -454,8 +787,7 @@ class DataValidator:
                 protein_warnings.append(f"Protein {protein['name']}: Very long sequence ({len(protein['sequence'])} AA) - may take longer to process")
             
             # Check for duplicate names
-            duplicate_names = [p['name'] for p in valid_proteins if p['name'] == protein['name']]
-            if duplicate_names:
+            if protein['name'] in valid_names:
                 protein_warnings.append(f"Protein {protein['name']}: Duplicate name found")
             
             # Add validation warnings from sequence validation
@@ -466,6 +798,7 @@ class DataValidator:
             # If no critical errors, add to valid list
             if not any('Missing or empty' in w or 'too short' in w for w in protein_warnings):
                 valid_proteins.append(protein)
+                valid_names.add(protein['name'])
             
             warnings.extend(protein_warnings)
         
@@ -482,6 +815,7 @@ class DataValidator:
             Tuple[List[Dict], List[str]]: (valid_rois, validation_warnings)
         """
         valid_rois = []
+        valid_keys = set()  # gene name + locus of every ROI in valid_rois
         warnings = []
         
         for i, roi in enumerate(roi_data):
@@ -507,8 +841,7 @@ class DataValidator:
             
             # Check for duplicate gene names with same locus
             duplicate_key = f"{roi['gene_name']}_{roi.get('roi_locus', '')}"
-            existing_keys = [f"{r['gene_name']}_{r.get('roi_locus', '')}" for r in valid_rois]
-            if duplicate_key in existing_keys:
+            if duplicate_key in valid_keys:
                 roi_warnings.append(f"ROI {roi['gene_name']}: Duplicate gene name and locus found")
             
             # Add validation warnings from sequence validation
@@ -519,6 +852,7 @@ class DataValidator:
             # If no critical errors, add to valid list
             if not any('Missing or empty' in w or 'too short' in w for w in roi_warnings):
                 valid_rois.append(roi)
+                valid_keys.add(duplicate_key)
             
             warnings.extend(roi_warnings)
         
@@ -543,19 +877,19 @@ class DataValidator:
             jobs = jobs[:max_jobs]
             warnings.append(f"Truncated to first {max_jobs} jobs")
         
+        # Count job names and complexity points in a single pass
+        name_counts = Counter()
+        total_complexity_score = 0
+        for job in jobs:
+            name_counts[job['job_name']] += 1
+            total_complexity_score += _COMPLEXITY_ORDER.get(job['estimated_complexity'], 3)
+        
         # Check for duplicate job names
-        job_names = [job['job_name'] for job in jobs]
-        duplicate_names = set([name for name in job_names if job_names.count(name) > 1])
+        duplicate_names = {name for name, count in name_counts.items() if count > 1}
         if duplicate_names:
             warnings.append(f"Duplicate job names found: {duplicate_names}")
         
         # Estimate total processing time
-        total_complexity_score = sum([
-            1 if job['estimated_complexity'] == 'Low' else 
-            2 if job['estimated_complexity'] == 'Medium' else 3 
-            for job in jobs
-        ])
-        
         estimated_hours = total_complexity_score * 0.5  # Rough estimate: 0.5 hours per complexity point
         if estimated_hours > 24:
             warnings.append(f"Estimated processing time: {estimated_hours:.1f} hours - consider splitting into multiple batches")
@@ -577,19 +911,16 @@ class DataExporter:
         try:
             import pandas as pd
             
-            # Prepare data for export
-            export_data = []
-            for protein in proteins:
-                export_data.append({
-                    'Protein Name': protein['name'],
-                    'Sequence Length (AA)': protein['length'],
-                    'Valid Sequence': protein.get('is_valid', True),
-                    'Warnings': '; '.join(protein.get('warnings', [])) if protein.get('warnings') else 'None',
-                    'Row Index': protein.get('row_index', 'Unknown')
-                })
-            
-            df = pd.DataFrame(export_data)
-            df.to_excel(output_path, index=False, sheet_name='Protein Summary')
+            # Prepare data for export column by column
+            df = pd.DataFrame({
+                'Protein Name': [protein['name'] for protein in proteins],
+                'Sequence Length (AA)': np.asarray([protein['length'] for protein in proteins], dtype=np.int32),
+                'Valid Sequence': [protein.get('is_valid', True) for protein in proteins],
+                'Warnings': ['; '.join(protein['warnings']) if protein.get('warnings') else 'None'
+                             for protein in proteins],
+                'Row Index': [protein.get('row_index', 'Unknown') for protein in proteins]
+            })
+            write_excel_constant_memory(output_path, {'Protein Summary': df})
             
         except Exception as e:
             raise Exception(f"Error exporting protein summary: {str(e)}")
@@ -605,24 +936,21 @@ class DataExporter:
         try:
             import pandas as pd
             
-            # Prepare data for export
-            export_data = []
-            for roi in roi_data:
-                export_data.append({
-                    'Gene Name': roi['gene_name'],
-                    'ROI Locus': roi['roi_locus'],
-                    'Sequence Length (bp)': len(roi['roi_sequence']),
-                    'GC Content (%)': roi.get('gc_content', 'Unknown'),
-                    'Accession': roi['accession'],
-                    'Species': roi['species'],
-                    'Status': roi['status'],
-                    'Valid Sequence': roi.get('is_valid', True),
-                    'Warnings': '; '.join(roi.get('warnings', [])) if roi.get('warnings') else 'None',
-                    'Row Index': roi.get('row_index', 'Unknown')
-                })
-            
-            df = pd.DataFrame(export_data)
-            df.to_excel(output_path, index=False, sheet_name='ROI Summary')
+            # Prepare data for export column by column
+            df = pd.DataFrame({
+                'Gene Name': [roi['gene_name'] for roi in roi_data],
+                'ROI Locus': [roi['roi_locus'] for roi in roi_data],
+                'Sequence Length (bp)': np.asarray([len(roi['roi_sequence']) for roi in roi_data], dtype=np.int32),
+                'GC Content (%)': [roi.get('gc_content', 'Unknown') for roi in roi_data],
+                'Accession': [roi['accession'] for roi in roi_data],
+                'Species': [roi['species'] for roi in roi_data],
+                'Status': [roi['status'] for roi in roi_data],
+                'Valid Sequence': [roi.get('is_valid', True) for roi in roi_data],
+                'Warnings': ['; '.join(roi['warnings']) if roi.get('warnings') else 'None'
+                             for roi in roi_data],
+                'Row Index': [roi.get('row_index', 'Unknown') for roi in roi_data]
+            })
+            write_excel_constant_memory(output_path, {'ROI Summary': df})
             
         except Exception as e:
             raise Exception(f"Error exporting ROI summary: {str(e)}")
@@ -638,23 +966,30 @@ class DataExporter:
         try:
             import pandas as pd
             
-            # Prepare data for export
-            export_data = []
-            for i, job in enumerate(jobs, 1):
-                export_data.append({
-                    'Job Number': i,
-                    'Job Name': job['job_name'],
-                    'Protein Name': job['protein_name'],
-                    'Protein Length (AA)': job['protein_length'],
-                    'Gene Name': job['gene_name'],
-                    'ROI Locus': job['roi_locus'],
-                    'DNA Length (bp)': len(job['dna_sequence']),
-                    'Estimated Complexity': job['estimated_complexity'],
-                    'Accession': job['accession'],
-                    'Species': job['species']
-                })
-            
-            df = pd.DataFrame(export_data)
+            # Prepare data for export column by column
+            df = pd.DataFrame({
+                'Job Number': np.arange(1, len(jobs) + 1, dtype=np.int32),
+                'Job Name': [job['job_name'] for job in jobs],
+                'Protein Name': [job['protein_name'] for job in jobs],
+                'Protein Length (AA)': np.asarray([job['protein_length'] for job in jobs], dtype=np.int32),
+                'Gene Name': [job['gene_name'] for job in jobs],
+                'ROI Locus': [job['roi_locus'] for job in jobs],
+                'DNA Length (bp)': np.asarray([len(job['dna_sequence']) for job in jobs], dtype=np.int32),
+                'Estimated Complexity': [job['estimated_complexity'] for job in jobs],
+                'Accession': [job['accession'] for job in jobs],
+                'Species': [job['species'] for job in jobs]
+            })
+            
+            # Gather summary statistics in a single pass over the jobs
+            complexity_counts = Counter()
+            protein_length_sum = dna_length_sum = 0
+            protein_names, gene_names = set(), set()
+            for job in jobs:
+                complexity_counts[job['estimated_complexity']] += 1
+                protein_length_sum += job['protein_length']
+                dna_length_sum += len(job['dna_sequence'])
+                protein_names.add(job['protein_name'])
+                gene_names.add(job['gene_name'])
             
             # Create summary statistics
             summary_data = {
@@ -670,21 +1005,19 @@ class DataExporter:
                 ],
                 'Value': [
                     len(jobs),
-                    len([j for j in jobs if j['estimated_complexity'] == 'Low']),
-                    len([j for j in jobs if j['estimated_complexity'] == 'Medium']),
-                    len([j for j in jobs if j['estimated_complexity'] == 'High']),
-                    round(sum([j['protein_length'] for j in jobs]) / len(jobs), 1) if jobs else 0,
-                    round(sum([len(j['dna_sequence']) for j in jobs]) / len(jobs), 1) if jobs else 0,
-                    len(set([j['protein_name'] for j in jobs])),
-                    len(set([j['gene_name'] for j in jobs]))
+                    complexity_counts['Low'],
+                    complexity_counts['Medium'],
+                    complexity_counts['High'],
+                    round(protein_length_sum / len(jobs), 1) if jobs else 0,
+                    round(dna_length_sum / len(jobs), 1) if jobs else 0,
+                    len(protein_names),
+                    len(gene_names)
                 ]
             }
             summary_df = pd.DataFrame(summary_data)
             
-            # Write to Excel with multiple sheets
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Job Plan', index=False)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            # Write to Excel with multiple sheets, streaming rows to disk
+            write_excel_constant_memory(output_path, {'Job Plan': df, 'Summary': summary_df})
             
         except Exception as e:
             raise Exception(f"Error exporting job plan: {str(e)}")
@@ -748,11 +1081,14 @@ def create_job_batch(proteins: List[Dict], roi_data: List[Dict],
     
     selected_protein = proteins[selected_protein_index]
     
-    # Create jobs for selected protein against all ROI data
-    jobs = []
-    for roi in roi_data:
-        job = JobPairGenerator.create_job_pair(selected_protein, roi)
-        jobs.append(job)
+    # Create jobs for selected protein against all ROI data, with one
+    # timestamp for the whole batch
+    now = datetime.now()
+    timestamp = now.strftime("%Y_%m_%d_%H_%M")
+    created_time = now.isoformat()
+    
+    jobs = [JobPairGenerator._create_job_pair(selected_protein, roi, timestamp, created_time)
+            for roi in roi_data]
     
     # Validate job batch
     valid_jobs, warnings = DataValidator.validate_job_batch(jobs, max_jobs)
@@ -5,68 +5,396 @@ This approach is more effective at avoiding Google's automation detection
 
 import os
 import time
-import pickle
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import atexit
+import asyncio
+import json
+import hashlib
+import io
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
+# undetected_chromedriver and selenium are imported where they are used, so
+# importing this module stays cheap (uc patches chromedriver on import).
 # Need to install: pip install undetected-chromedriver
-import undetected_chromedriver as uc
+
+# Elements only present once signed in (links to the submit page / dashboard)
+LOGGED_IN_SELECTOR = "a[href*='submit'], a[href*='dashboard']"
+
+# Runs before page scripts on every new document: hides navigator.webdriver
+# and removes chromedriver's tell-tale $cdc_ / $chrome_asyncScriptInfo globals
+STEALTH_JS = """
+    // Overwrite the navigator.webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    // Remove chromedriver markers
+    for (const key of Object.keys(window)) {
+        if (key.startsWith('$cdc_') || key.startsWith('cdc_')) {
+            delete window[key];
+        }
+    }
+    delete window.$chrome_asyncScriptInfo;
+    delete document.$cdc_asdjflasutopfhvcZLmcfl_;
+"""
+
+# Patched chromedriver kept between runs (uc re-downloads and patches otherwise)
+DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "undetected_chrome")
+DRIVER_CACHE_NAME = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+
+# Seconds an unattended run waits for the LOGIN_SENTINEL file before giving up
+SENTINEL_TIMEOUT = 600
+
+# Chrome switches for subsystems the login automation never needs
+BACKGROUND_DISABLE_ARGS = [
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-breakpad",
+    "--disk-cache-size=33554432",
+]
+
+# sameSite values accepted by CDP's Network.setCookies
+_CDP_SAME_SITE_VALUES = {"Strict", "Lax", "None"}
 
 class StealthBrowser:
     """Class for browser automation that avoids detection"""
     
     def __init__(self):
         self.driver = None
-        self.cookies_file = "alphafold_cookies.pkl"
+        self.wait = None  # WebDriverWait shared by this browser's explicit waits
+        self.cookies_file = "alphafold_cookies.json"
+        # Pickle store shared with AlphaFoldLogin and the GUI (None: JSON only)
+        self.pickle_cookies_file = "alphafold_cookies.pkl"
         self.screenshots_dir = "browser_screenshots"
+        self.block_images = True  # Skip image downloads when replaying cookie logins
+        
+        # Create the screenshots directory once rather than on every screenshot
+        os.makedirs(self.screenshots_dir, exist_ok=True)
+        
+        # Digest of the capture last written under each screenshot name, kept
+        # across runs so a step whose page has not changed is not rewritten
+        self._shot_index = os.path.join(self.screenshots_dir, "digests.json")
+        try:
+            with open(self._shot_index, "r", encoding="utf-8") as f:
+                self._shot_digests = json.load(f)
+        except (OSError, ValueError):
+            self._shot_digests = {}
+        # Forget screenshots that have been deleted since
+        self._shot_digests = {
+            name: digest for name, digest in self._shot_digests.items()
+            if os.path.exists(f"{self.screenshots_dir}/{name}.png")
+        }
+        
+        # Single writer thread, so screenshots are saved in the order they are taken
+        self._shot_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Parsed cookies and the file mtime they were read at
+        self._cookie_cache = None
+        self._cookie_mtime = 0
     
     def take_screenshot(self, name):
-        """Take a screenshot for debugging"""
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        """Take a screenshot for debugging, skipping it if the file on disk already shows it"""
         if self.driver:
-            self.driver.save_screenshot(f"{self.screenshots_dir}/{name}.png")
+            png = self.driver.get_screenshot_as_png()
+            digest = hashlib.sha256(png).hexdigest()
+            if self._shot_digests.get(name) == digest:
+                print(f"Screenshot skipped (unchanged): {name}.png")
+                return
+            self._shot_digests[name] = digest
+            
+            # Write in the background so the next navigation can start right away
+            self._shot_pool.submit(self._write_png, name, png)
+    
+    def _write_png(self, name, data):
+        """Write screenshot bytes to the screenshots directory and record their digest
+        
+        Runs on the writer thread, so errors are reported here rather than raised.
+        """
+        try:
+            with open(f"{self.screenshots_dir}/{name}.png", "wb") as f:
+                f.write(self._compress_png(data))
+            self._replace_file(self._shot_index, json.dumps(dict(self._shot_digests)).encode("utf-8"))
             print(f"Screenshot saved: {name}.png")
+        except Exception as e:
+            # Forget the digest so the next identical screenshot is written again
+            self._shot_digests.pop(name, None)
+            print(f"Error saving screenshot {name}.png: {e}")
+    
+    @staticmethod
+    def _compress_png(data):
+        """Re-encode a screenshot as an optimized palette PNG if Pillow is installed
+        
+        Returns:
+            bytes: The smaller PNG, or data unchanged without Pillow
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return data
+        
+        image = Image.open(io.BytesIO(data)).convert("P", palette=Image.ADAPTIVE)
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+        return output.getvalue()
+    
+    @staticmethod
+    def wait_for_signal(sentinel=None, prompt=None, timeout=SENTINEL_TIMEOUT):
+        """Wait for the user (Enter on stdin) or, unattended, for a sentinel file
+        
+        A sentinel left over from an earlier wait is removed first, and the
+        sentinel is removed again once seen, so every wait needs a fresh signal.
+        
+        Args:
+            sentinel (str, optional): File whose creation signals to continue;
+                polled every 0.5 s (e.g. set LOGIN_SENTINEL and touch it from CI)
+            prompt (str, optional): Prompt shown when waiting for Enter
+            timeout (float, optional): Seconds to wait for the sentinel (None: forever)
+            
+        Returns:
+            bool: True if signalled, False if the sentinel wait timed out
+        """
+        if not sentinel:
+            input(prompt or "Press Enter to continue...")
+            return True
+        
+        if os.path.exists(sentinel):
+            os.remove(sentinel)
+        
+        print(f"Waiting for {sentinel} to be created...")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not os.path.exists(sentinel):
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"Timed out after {timeout} s waiting for {sentinel}")
+                return False
+            time.sleep(0.5)
+        
+        os.remove(sentinel)
+        return True
+    
+    def save_cookies(self, cookies):
+        """Write cookies to the JSON cookie file, and the shared pickle file, atomically
+        
+        The pickle copy is written first, so the JSON file is never older than
+        it and sync_pickle_cookies() will not convert it back.
+        
+        Args:
+            cookies (list): Cookie dictionaries as returned by driver.get_cookies()
+        """
+        if self.pickle_cookies_file:
+            import pickle  # Format of the store read by AlphaFoldLogin and the GUI
+            
+            self._replace_file(self.pickle_cookies_file, pickle.dumps(cookies))
+        self._write_json_cookies(cookies)
+    
+    def _write_json_cookies(self, cookies):
+        """Write cookies to the JSON cookie file atomically and refresh the cache"""
+        self._replace_file(self.cookies_file, json.dumps(cookies).encode("utf-8"))
+        
+        self._cookie_cache = cookies
+        self._cookie_mtime = os.stat(self.cookies_file).st_mtime
+    
+    @staticmethod
+    def _replace_file(path, data):
+        """Write bytes to a temporary file and swap it in with os.replace"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def load_cookies(self):
+        """Load saved cookies, re-reading the file only when it has changed
+        
+        Returns:
+            list: Copies of the saved cookie dictionaries
+        """
+        mtime = os.stat(self.cookies_file).st_mtime
+        if self._cookie_cache is None or mtime != self._cookie_mtime:
+            with open(self.cookies_file, "r", encoding="utf-8") as f:
+                self._cookie_cache = json.load(f)
+            self._cookie_mtime = mtime
+        
+        # Hand out copies so callers can adjust cookies without touching the cache
+        return [dict(cookie) for cookie in self._cookie_cache]
+    
+    def sync_pickle_cookies(self):
+        """Convert the shared pickle cookie file to JSON when it is newer
+        
+        AlphaFoldLogin and the GUI read and write the pickle file, so cookies
+        they refresh are picked up here as well.
+        
+        Returns:
+            bool: True if cookies were converted from the pickle file
+        """
+        if not self.pickle_cookies_file or not os.path.exists(self.pickle_cookies_file):
+            return False
+        if (os.path.exists(self.cookies_file)
+                and os.stat(self.cookies_file).st_mtime >= os.stat(self.pickle_cookies_file).st_mtime):
+            return False
+        
+        import pickle
+        
+        with open(self.pickle_cookies_file, "rb") as f:
+            cookies = pickle.load(f)
+        self._write_json_cookies(cookies)
+        print(f"Converted {len(cookies)} cookies from {self.pickle_cookies_file} to {self.cookies_file}")
+        return True
+    
+    @staticmethod
+    def _to_cdp_cookie(cookie):
+        """Convert a WebDriver cookie dict to a CDP Network.CookieParam
+        
+        Args:
+            cookie (dict): Cookie as returned by driver.get_cookies()
+            
+        Returns:
+            dict: Cookie accepted by Network.setCookies
+        """
+        cdp_cookie = dict(cookie)
+        if 'expiry' in cdp_cookie:
+            cdp_cookie['expires'] = cdp_cookie.pop('expiry')
+        cdp_cookie.setdefault('domain', ".alphafoldserver.com")
+        cdp_cookie.setdefault('path', "/")
+        if cdp_cookie.get('sameSite') not in _CDP_SAME_SITE_VALUES:
+            cdp_cookie.pop('sameSite', None)
+        return cdp_cookie
+    
+    def _chrome_options(self, uc, use_profile, block_images, headless):
+        """Build the ChromeOptions for a new browser (uc does not allow reusing them)
+        
+        Args:
+            uc: The undetected_chromedriver module
+            use_profile (bool): Use the persistent AlphaFold Chrome profile
+            block_images (bool): Disable image loading
+            headless (bool): Run without a window
+            
+        Returns:
+            uc.ChromeOptions: Options for uc.Chrome
+        """
+        # Create options specifically for undetected-chromedriver
+        options = uc.ChromeOptions()
+        
+        # Set basic options
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920,1080")
+        
+        # Turn off subsystems that only add network traffic and startup work
+        for argument in BACKGROUND_DISABLE_ARGS:
+            options.add_argument(argument)
+        
+        # uc merges prefs into the profile on disk, so the image setting is
+        # always written (1 = allow, 2 = block) instead of left over from a
+        # previous run that used the same profile
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.managed_default_content_settings.images": 2 if block_images else 1,
+        }
+        if block_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", prefs)
+        
+        # uc adds --headless=new itself; these make headless Chrome start cleanly
+        if headless:
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-setuid-sandbox")
+        
+        # Add user agent
+        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+        
+        # Use a Chrome profile if requested
+        if use_profile:
+            # Modify this path for your system
+            user_data_dir = os.path.join(os.path.expanduser("~"), "alphafold_chrome_profile")
+            os.makedirs(user_data_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            print(f"Using Chrome profile at: {user_data_dir}")
+        
+        return options
+    
+    @staticmethod
+    def _cached_driver_path():
+        """Return the patched chromedriver kept from an earlier run, if any
+        
+        Returns:
+            str: Path of the cached driver, or None if there is none
+        """
+        path = os.path.join(DRIVER_CACHE_DIR, DRIVER_CACHE_NAME)
+        return path if os.path.exists(path) else None
     
-    def init_stealth_browser(self, use_profile=False):
-        """Initialize a browser that avoids detection"""
+    def _cache_driver(self):
+        """Keep a copy of the patched chromedriver so later runs skip download and patching"""
         try:
-            # Create options specifically for undetected-chromedriver
-            options = uc.ChromeOptions()
-            
-            # Set basic options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-            
-            # Add user agent
-            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
-            
-            # Use a Chrome profile if requested
-            if use_profile:
-                # Modify this path for your system
-                user_data_dir = os.path.join(os.path.expanduser("~"), "alphafold_chrome_profile")
-                os.makedirs(user_data_dir, exist_ok=True)
-                options.add_argument(f"--user-data-dir={user_data_dir}")
-                print(f"Using Chrome profile at: {user_data_dir}")
-            
-            # Initialize undetected Chrome
-            self.driver = uc.Chrome(
-                options=options,
-                driver_executable_path=None,  # Auto download
-                version_main=None,  # Auto detect
-                headless=False  # Must be False for Google login
-            )
-            
-            # Additional protection via JavaScript execution
-            self.driver.execute_script("""
-                // Overwrite the navigator.webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
+            source = self.driver.service.path
+            if not source or not os.path.exists(source):
+                return
+            
+            os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=DRIVER_CACHE_DIR)
+            os.close(fd)
+            shutil.copy2(source, tmp_path)
+            os.replace(tmp_path, os.path.join(DRIVER_CACHE_DIR, DRIVER_CACHE_NAME))
+        except Exception as e:
+            print(f"Warning: Could not cache chromedriver: {e}")
+    
+    def init_stealth_browser(self, use_profile=False, block_images=None, headless=False):
+        """Initialize a browser that avoids detection
+        
+        Args:
+            use_profile (bool): Use the persistent AlphaFold Chrome profile
+            block_images (bool, optional): Disable image loading (defaults to self.block_images)
+            headless (bool): Run without a window (new headless mode); only for
+                cookie replay, Google login must stay headed
+        """
+        if block_images is None:
+            block_images = self.block_images
+        
+        try:
+            import undetected_chromedriver as uc
+            from selenium.webdriver.support.ui import WebDriverWait
+            
+            # Initialize undetected Chrome, reusing the driver patched on an earlier run
+            cached_driver = self._cached_driver_path()
+            try:
+                self.driver = uc.Chrome(
+                    options=self._chrome_options(uc, use_profile, block_images, headless),
+                    driver_executable_path=cached_driver,  # None: auto download and patch
+                    version_main=None,  # Auto detect
+                    headless=headless  # Must be False for Google login
+                )
+            except Exception as e:
+                if cached_driver is None:
+                    raise
+                # Most likely Chrome was updated; drop the stale driver and fetch a new one
+                print(f"Cached chromedriver failed ({e}), downloading a fresh one")
+                os.remove(cached_driver)
+                self.driver = uc.Chrome(
+                    options=self._chrome_options(uc, use_profile, block_images, headless),
+                    driver_executable_path=None,
+                    version_main=None,
+                    headless=headless
+                )
+            
+            if self._cached_driver_path() is None:
+                self._cache_driver()
+            
+            # Make sure Chrome and chromedriver do not outlive the process
+            atexit.register(self.cleanup)
+            
+            # One wait object for all explicit waits, polling every 100 ms
+            self.wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
+            
+            # Additional protection, injected before any page script on every
+            # document this browser loads from now on
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS})
             
             print("Undetected Chrome initialized successfully")
             return True
@@ -77,7 +405,8 @@ class StealthBrowser:
     def manual_login_and_save_cookies(self):
         """Open browser for manual login and save cookies"""
         if not self.driver:
-            if not self.init_stealth_browser(use_profile=True):
+            # Images stay on here: the Google sign-in flow may need them
+            if not self.init_stealth_browser(use_profile=True, block_images=False):
                 print("Failed to initialize browser")
                 return False
         
@@ -93,20 +422,24 @@ class StealthBrowser:
             print("2. Complete the Google sign-in process in the browser window")
             print("3. Accept all terms of service if prompted")
             print("4. Navigate all the way to the AlphaFold dashboard/submit page")
-            input("Press Enter once you've successfully logged in...")
+            if not self.wait_for_signal(os.environ.get("LOGIN_SENTINEL"),
+                                        "Press Enter once you've successfully logged in..."):
+                # Keep the existing cookies rather than saving pre-login ones
+                print("No login confirmation received; cookies not saved")
+                return False
             
             # Check if login was successful
             self.take_screenshot("2_after_login")
             
             # Save cookies
             cookies = self.driver.get_cookies()
-            with open(self.cookies_file, "wb") as f:
-                pickle.dump(cookies, f)
+            self.save_cookies(cookies)
             print(f"Saved {len(cookies)} cookies to {self.cookies_file}")
             
-            # Save page source for analysis
-            with open("alphafold_page.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+            # Save page source for analysis; outerHTML is fetched once and written as bytes
+            html = self.driver.execute_script("return document.documentElement.outerHTML")
+            with open("alphafold_page.html", "wb") as f:
+                f.write(html.encode("utf-8"))
             print("Saved page source to alphafold_page.html")
             
             return True
@@ -116,6 +449,12 @@ class StealthBrowser:
     
     def login_with_cookies(self):
         """Login using saved cookies"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        self.sync_pickle_cookies()
+        
         if not os.path.exists(self.cookies_file):
             print(f"Cookie file not found: {self.cookies_file}")
             return False
@@ -126,66 +465,318 @@ class StealthBrowser:
                 return False
         
         try:
-            # First visit the domain
-            self.driver.get("https://alphafoldserver.com")
-            
-            # Add cookies to browser
-            with open(self.cookies_file, "rb") as f:
-                cookies = pickle.load(f)
-            
-            for cookie in cookies:
-                try:
-                    # Handle expiry
-                    if 'expiry' in cookie:
-                        del cookie['expiry']
-                    
-                    self.driver.add_cookie(cookie)
-                except Exception as e:
-                    print(f"Warning: Could not add cookie {cookie.get('name')}: {e}")
+            # Add all cookies to the browser in a single CDP message; unlike
+            # add_cookie this needs no page of the domain to be loaded first
+            cookies = self.load_cookies()
+            
+            try:
+                self.driver.execute_cdp_cmd("Network.setCookies", {
+                    "cookies": [self._to_cdp_cookie(cookie) for cookie in cookies]
+                })
+            except Exception as e:
+                print(f"CDP cookie injection failed ({e}), adding cookies one by one")
+                
+                # add_cookie only works for the domain currently loaded
+                self.driver.get("https://alphafoldserver.com")
+                
+                # Handle expiry once up front, then report rejected cookies together
+                failed = []
+                for cookie in [{k: v for k, v in cookie.items() if k != 'expiry'} for cookie in cookies]:
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception:
+                        failed.append(cookie.get('name'))
+                if failed:
+                    print(f"Warning: {len(failed)} cookies rejected: {', '.join(map(str, failed))}")
             
             # Navigate to main page
             self.driver.get("https://alphafoldserver.com/welcome")
             self.take_screenshot("3_after_cookie_login")
             
-            # Check if login was successful
-            time.sleep(2)
-            
-            if "submit" in self.driver.page_source.lower() or "dashboard" in self.driver.page_source.lower():
-                print("Login successful using cookies!")
-                return True
-            else:
+            # Check if login was successful: wait for the signed-in pages or
+            # their links instead of sleeping and scanning the whole page source
+            try:
+                self.wait.until(EC.any_of(
+                    EC.url_contains("submit"),
+                    EC.url_contains("dashboard"),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, LOGGED_IN_SELECTOR))
+                ))
+            except TimeoutException:
                 print("Cookie login failed. Cookies may have expired.")
                 return False
+            
+            print("Login successful using cookies!")
+            return True
         except Exception as e:
             print(f"Error during cookie login: {e}")
             return False
     
+    async def login_with_cookies_async(self):
+        """Run login_with_cookies on a worker thread so several logins can overlap
+        
+        Returns:
+            bool: True if the cookie login succeeded
+        """
+        return await asyncio.to_thread(self.login_with_cookies)
+    
+    @contextmanager
+    def session(self, use_profile=True, block_images=None, headless=False):
+        """Run a block with a started browser, closing it however the block exits
+        
+        Args:
+            use_profile (bool): Use the persistent AlphaFold Chrome profile
+            block_images (bool, optional): Disable image loading (defaults to
+                self.block_images); pass False for manual Google login
+            headless (bool): Run without a window (cookie replay only)
+            
+        Yields:
+            The WebDriver instance
+            
+        Raises:
+            RuntimeError: If the browser could not be started
+        """
+        if not self.driver and not self.init_stealth_browser(
+                use_profile=use_profile, block_images=block_images, headless=headless):
+            raise RuntimeError("Failed to initialize browser")
+        try:
+            yield self.driver
+        finally:
+            self.cleanup()
+    
     def cleanup(self):
-        """Close the browser"""
+        """Close the browser, after any pending screenshots have been written"""
+        self._shot_pool.shutdown(wait=True)
+        self._shot_pool = ThreadPoolExecutor(max_workers=1)
+        
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self.wait = None
+            atexit.unregister(self.cleanup)
             print("Browser closed")
 
-def main():
-    browser = StealthBrowser()
+def _start_browsers(start_browser, count):
+    """Start several browsers, in parallel once a patched chromedriver is cached
+    
+    Until the driver cache is filled, every uc start downloads and patches the
+    same shared chromedriver binary, so parallel first starts would race on it.
+    Browsers are therefore started one at a time until the cache exists.
     
-    # First run: Manual login and save cookies
-    # Uncomment this line for first run, then comment it out
-    #browser.manual_login_and_save_cookies()
+    Args:
+        start_browser: Callable starting and returning one browser (or None)
+        count (int): Number of browsers to start
+        
+    Returns:
+        list: Results of start_browser, one per browser
+    """
+    browsers = []
+    while len(browsers) < count and StealthBrowser._cached_driver_path() is None:
+        browsers.append(start_browser())
     
-    # Subsequent runs: Use cookies for login
-    success = browser.login_with_cookies()
+    remaining = count - len(browsers)
+    if remaining:
+        with ThreadPoolExecutor(max_workers=remaining) as executor:
+            browsers.extend(executor.map(lambda _: start_browser(), range(remaining)))
+    return browsers
+
+class BrowserPool:
+    """Pool of pre-started StealthBrowser instances
     
-    # if success:
-    #     print("Successfully logged in to AlphaFold!")
-    #     # Now you can continue with your automation tasks
-    # else:
-    #     print("Login failed!")
+    Starting undetected Chrome takes a few seconds (driver patching, profile
+    load, CDP handshake), so browsers are started once up front and handed
+    out repeatedly. A browser is recycled after max_uses acquisitions and
+    replaced in the background.
+    """
     
-    # Don't close the browser automatically - let user see the result
-    input("Press Enter to close the browser...")
-    browser.cleanup()
+    def __init__(self, size=4, max_uses=50, headless=False):
+        """Start the pool's browsers (in parallel once the driver is cached)
+        
+        Args:
+            size (int): Number of browsers to keep ready
+            max_uses (int): Uses after which a browser is closed and replaced
+            headless (bool): Start the browsers headless (cookie replay only)
+            
+        Raises:
+            RuntimeError: If none of the browsers could be started
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self._available = queue.Queue(maxsize=size)
+        self._uses = {}  # id(browser) -> number of completed uses
+        self._lock = threading.Lock()
+        self._closed = False
+        
+        browsers = [browser for browser in _start_browsers(self._start_browser, size) if browser is not None]
+        if not browsers:
+            raise RuntimeError("Could not start any browsers for the pool")
+        
+        self._live = len(browsers)  # Browsers owned by the pool, idle or in use
+        for browser in browsers:
+            self._add(browser, 0)
+    
+    def _start_browser(self):
+        """Start one browser without a shared profile (profiles cannot be shared)
+        
+        Returns:
+            StealthBrowser: The started browser, or None if startup failed
+        """
+        browser = StealthBrowser()
+        if browser.init_stealth_browser(use_profile=False, headless=self.headless):
+            return browser
+        return None
+    
+    def _add(self, browser, uses):
+        """Make a browser available to acquire()"""
+        with self._lock:
+            self._uses[id(browser)] = uses
+        self._available.put(browser)
+    
+    def _replace(self, browser):
+        """Close a worn-out browser and add a freshly started one"""
+        browser.cleanup()
+        replacement = self._start_browser()
+        if replacement is None:
+            with self._lock:
+                self._live -= 1
+            print("Failed to start a replacement browser; pool size reduced")
+        elif self._closed:
+            replacement.cleanup()
+        else:
+            self._add(replacement, 0)
+    
+    def acquire(self, timeout=None):
+        """Take a browser from the pool, waiting until one is free
+        
+        Args:
+            timeout (float, optional): Seconds to wait before giving up
+            
+        Returns:
+            StealthBrowser: A browser with a running driver
+            
+        Raises:
+            queue.Empty: If no browser became available within the timeout
+            RuntimeError: If the pool is closed or has no browsers left (all
+                replacements failed)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._live <= 0:
+                    raise RuntimeError("No browsers left in the pool")
+            
+            # Wait in short slices so a pool that empties meanwhile is noticed
+            wait = 0.5
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise queue.Empty
+            try:
+                return self._available.get(timeout=wait)
+            except queue.Empty:
+                continue
+    
+    def release(self, browser):
+        """Return a browser to the pool, recycling it after max_uses uses
+        
+        Args:
+            browser (StealthBrowser): Browser previously returned by acquire()
+        """
+        with self._lock:
+            uses = self._uses.pop(id(browser), 0) + 1
+        
+        if self._closed:
+            browser.cleanup()
+        elif uses >= self.max_uses or browser.driver is None:
+            threading.Thread(target=self._replace, args=(browser,), daemon=True).start()
+        else:
+            self._add(browser, uses)
+    
+    def close(self):
+        """Close every browser currently in the pool
+        
+        Browsers still in use are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                browser = self._available.get_nowait()
+            except queue.Empty:
+                break
+            browser.cleanup()
+
+async def login_many(cookie_files, headless=False):
+    """Log in one browser per cookie file concurrently
+    
+    Browsers are started without the shared Chrome profile, since one profile
+    cannot be used by several browsers at once.
+    
+    Args:
+        cookie_files (list): Paths of saved cookie files, one per session
+        headless (bool): Start the browsers headless
+        
+    Returns:
+        list: (StealthBrowser, success) tuples in the order of cookie_files;
+            the caller is responsible for cleaning up the browsers
+    """
+    def start_browser():
+        browser = StealthBrowser()
+        browser.init_stealth_browser(use_profile=False, headless=headless)
+        return browser
+    
+    async def login_one(browser, cookie_file):
+        browser.cookies_file = cookie_file
+        browser.pickle_cookies_file = None  # Per-session files, not the shared store
+        success = browser.driver is not None and await browser.login_with_cookies_async()
+        return browser, success
+    
+    browsers = await asyncio.to_thread(_start_browsers, start_browser, len(cookie_files))
+    return await asyncio.gather(*(login_one(browser, cookie_file)
+                                  for browser, cookie_file in zip(browsers, cookie_files)))
+
+def main():
+    # First run: set this to True for a manual login that saves cookies, then
+    # set it back to False
+    manual_login = False
+    
+    if manual_login:
+        # Manual sign-in needs the Chrome profile and images, so it gets its
+        # own browser rather than a pooled one; closed when the block exits
+        browser = StealthBrowser()
+        with browser.session(block_images=False):
+            browser.manual_login_and_save_cookies()
+            
+            # Don't close the browser automatically - let user see the result
+            browser.wait_for_signal(os.environ.get("LOGIN_SENTINEL"), "Press Enter to close the browser...")
+        return
+    
+    # Subsequent runs: Use cookies for login. A pipeline submitting many jobs
+    # keeps one pool and acquires a browser per job instead of starting Chrome
+    pool = BrowserPool(size=1)
+    try:
+        browser = pool.acquire()
+        try:
+            success = browser.login_with_cookies()
+            
+            # if success:
+            #     print("Successfully logged in to AlphaFold!")
+            #     # Now you can continue with your automation tasks
+            # else:
+            #     print("Login failed!")
+            
+            # Don't close the browser automatically - let user see the result.
+            # Unattended runs (LOGIN_SENTINEL set) close it straight away unless
+            # KEEP_OPEN_SENTINEL names a file to wait for
+            keep_open = os.environ.get("KEEP_OPEN_SENTINEL")
+            if keep_open or not os.environ.get("LOGIN_SENTINEL"):
+                browser.wait_for_signal(keep_open, "Press Enter to close the browser...")
+        finally:
+            pool.release(browser)
+    finally:
+        pool.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file